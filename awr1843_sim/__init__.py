@@ -0,0 +1,48 @@
+# --- Package exports (resolved lazily, see PEP 562) ---
+# Importing awr1843_sim must stay side-effect free and cheap: submodules are only
+# imported when one of their names is first accessed.
+import importlib
+
+_EXPORTS = {
+    "AWR1843Radar": ".main",
+    "ProfileConfig": ".configs",
+    "ChirpConfig": ".configs",
+    "FrameConfig": ".configs",
+    "SPIInterface": ".communication_interfaces",
+    "UARTInterface": ".communication_interfaces",
+    "PointCloudClustering": ".clustering",
+    "LatencyTracer": ".tracing",
+    "FrameTrace": ".tracing",
+    "SceneSimulator": ".scene_simulator",
+    "Subject": ".scene_simulator",
+    "VitalSignScene": ".scene_simulator",
+    "MicroDopplerSTFT": ".micro_doppler",
+    "CaptureWatchdog": ".watchdog",
+    "WatchdogMetrics": ".watchdog",
+    "AWR1843DeviceEmulator": ".device_emulator",
+    "EmulatedUARTInterface": ".device_emulator",
+    "FaultConfig": ".device_emulator",
+    "RawData": ".data_place_holders",
+    "PointCloud": ".data_place_holders",
+    "TargetList": ".data_place_holders",
+    "CalibData": ".data_place_holders",
+}
+
+# Modules that need NumPy stay reachable by name but are left out of
+# ``from awr1843_sim import *`` so it works without NumPy installed.
+_NUMPY_MODULES = {".scene_simulator", ".micro_doppler"}
+
+__all__ = sorted(name for name, mod in _EXPORTS.items() if mod not in _NUMPY_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,5 @@
 # --- Functional Sub-components (Simulated) ---
-from typing import Optional
+from typing import List, Optional
 from .communication_interfaces import UARTInterface
 from .data_place_holders import CalibData
 
@@ -9,20 +9,22 @@ class Calibration:
         self._radar_uart = radar_uart
         self.is_calibrated = False
         self._calib_data: Optional[CalibData] = None
+        self._calib_commands: List[str] = []  # Sent by the last self-calibration
         print("Calibration module initialized.")
 
     def performSelfCal(self) -> bool:
         print("Calibration: Performing self-calibration...")
         self._radar_uart.sendCommand("sensorStop")  # Stop sensor before calibration
         self._radar_uart.readResponse()
-        # Example calibration command sequence
-        self._radar_uart.sendCommand(
-            "calibDcRangeSigCfg -1 0 1 2 3 4 5 6 7"
-        )  # Simplified
-        self._radar_uart.readResponse()
-        self._radar_uart.sendCommand("calibDcRangeSigCfg -1 1 1 2 3 4 5 6 7")
-        self._radar_uart.readResponse()
-        # ... more calib commands ...
+        # Example calibration command sequence (simplified)
+        self._calib_commands = [
+            "calibDcRangeSigCfg -1 0 1 2 3 4 5 6 7",
+            "calibDcRangeSigCfg -1 1 1 2 3 4 5 6 7",
+            # ... more calib commands ...
+        ]
+        for command in self._calib_commands:
+            self._radar_uart.sendCommand(command)
+            self._radar_uart.readResponse()
         print("Calibration: Self-calibration sequence (simulated) sent.")
         # Simulate successful calibration
         self.is_calibrated = True
@@ -32,6 +34,20 @@ class Calibration:
         print("Calibration: Completed successfully.")
         return True
 
+    def replayCalibCommands(self) -> bool:
+        """Re-sends the last calibration commands, e.g. after a ``flushCfg``."""
+        if not (self.is_calibrated and self._calib_commands):
+            print("Calibration: Nothing to replay, not calibrated.")
+            return False
+        for command in self._calib_commands:
+            self._radar_uart.sendCommand(command)
+            if "Done" not in self._radar_uart.readResponse():
+                print(f"Calibration: Replay failed on '{command}'.")
+                self.is_calibrated = False
+                return False
+        print("Calibration: Calibration commands replayed.")
+        return True
+
     def getCalibData(self) -> Optional[CalibData]:
         if self.is_calibrated and self._calib_data:
             print("Calibration: Returning calibration data.")
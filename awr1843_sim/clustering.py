@@ -0,0 +1,142 @@
+import math
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from .data_place_holders import TargetList
+
+# --- Point-cloud clustering (grid-accelerated DBSCAN) ---
+
+Cell = Tuple[int, int, int, int]
+
+
+class PointCloudClustering:
+    """Groups CFAR detections into objects with DBSCAN over (x, y, z, doppler).
+
+    Points are hashed into a uniform grid whose cells are ``eps`` wide in the
+    scaled space, so every neighbor query only looks at the 3^4 adjacent cells
+    instead of all other points. Doppler is scaled by ``eps / epsDoppler`` so a
+    velocity difference of ``epsDoppler`` counts as much as ``eps`` metres.
+    """
+
+    def __init__(
+        self,
+        eps: float = 0.5,  # Neighborhood radius in metres
+        epsDoppler: float = 1.0,  # Doppler difference equivalent to eps (m/s)
+        minPoints: int = 3,  # Core point threshold (including the point itself)
+    ):
+        if eps <= 0 or epsDoppler <= 0:
+            raise ValueError("eps and epsDoppler must be positive")
+        self.eps = eps
+        self.epsDoppler = epsDoppler
+        self.minPoints = minPoints
+        self._doppler_scale = eps / epsDoppler
+        self._neighbor_offsets = [
+            (a, b, c, d)
+            for a in (-1, 0, 1)
+            for b in (-1, 0, 1)
+            for c in (-1, 0, 1)
+            for d in (-1, 0, 1)
+        ]
+        print(
+            f"PointCloudClustering initialized: eps={eps} m, "
+            f"epsDoppler={epsDoppler} m/s, minPoints={minPoints}"
+        )
+
+    def _cell(self, p: Tuple[float, float, float, float]) -> Cell:
+        return (
+            math.floor(p[0] / self.eps),
+            math.floor(p[1] / self.eps),
+            math.floor(p[2] / self.eps),
+            math.floor(p[3] / self.eps),
+        )
+
+    def _neighbors(
+        self,
+        idx: int,
+        coords: List[Tuple[float, float, float, float]],
+        cells: List[Cell],
+        grid: Dict[Cell, List[int]],
+    ) -> List[int]:
+        px, py, pz, pv = coords[idx]
+        cx, cy, cz, cv = cells[idx]
+        eps_sq = self.eps * self.eps
+        found = []
+        for a, b, c, d in self._neighbor_offsets:
+            bucket = grid.get((cx + a, cy + b, cz + c, cv + d))
+            if not bucket:
+                continue
+            for j in bucket:
+                qx, qy, qz, qv = coords[j]
+                dist_sq = (
+                    (px - qx) ** 2 + (py - qy) ** 2 + (pz - qz) ** 2 + (pv - qv) ** 2
+                )
+                if dist_sq <= eps_sq:
+                    found.append(j)
+        return found
+
+    def labelPoints(self, coords: List[Tuple[float, float, float, float]]) -> List[int]:
+        """Returns a cluster label per (x, y, z, doppler) point; -1 marks noise."""
+        scaled = [(x, y, z, v * self._doppler_scale) for x, y, z, v in coords]
+        cells = [self._cell(p) for p in scaled]
+        grid: Dict[Cell, List[int]] = defaultdict(list)
+        for i, cell in enumerate(cells):
+            grid[cell].append(i)
+
+        labels = [-2] * len(scaled)  # -2: unvisited, -1: noise
+        cluster_id = 0
+        for i in range(len(scaled)):
+            if labels[i] != -2:
+                continue
+            seeds = self._neighbors(i, scaled, cells, grid)
+            if len(seeds) < self.minPoints:
+                labels[i] = -1
+                continue
+            labels[i] = cluster_id
+            queue = seeds
+            while queue:
+                j = queue.pop()
+                if labels[j] == -1:
+                    labels[j] = cluster_id  # Border point previously marked as noise
+                if labels[j] != -2:
+                    continue
+                labels[j] = cluster_id
+                neighbors = self._neighbors(j, scaled, cells, grid)
+                if len(neighbors) >= self.minPoints:
+                    queue.extend(n for n in neighbors if labels[n] < 0)
+            cluster_id += 1
+        return labels
+
+    def cluster(self, targets: TargetList) -> TargetList:
+        """Collapses CFAR detections into one centroid target per cluster."""
+        detections = targets.targets
+        coords = [
+            (t["position"][0], t["position"][1], t["position"][2], t["velocity"])
+            for t in detections
+        ]
+        labels = self.labelPoints(coords)
+
+        members: Dict[int, List[int]] = defaultdict(list)
+        for i, label in enumerate(labels):
+            if label >= 0:
+                members[label].append(i)
+
+        clustered = []
+        for label in sorted(members):
+            pts = [coords[i] for i in members[label]]
+            n = len(pts)
+            xs, ys, zs, vs = zip(*pts)
+            clustered.append(
+                {
+                    "id": label,
+                    "position": (sum(xs) / n, sum(ys) / n, sum(zs) / n),
+                    "velocity": sum(vs) / n,
+                    "extent": (max(xs) - min(xs), max(ys) - min(ys), max(zs) - min(zs)),
+                    "num_points": n,
+                }
+            )
+        num_noise = len(labels) - sum(len(m) for m in members.values())
+        print(
+            f"PointCloudClustering: {len(detections)} detections -> "
+            f"{len(clustered)} clusters ({num_noise} noise points)."
+        )
+        return TargetList(clustered)
@@ -1,3 +1,4 @@
+import time
 from typing import Optional
 
 
@@ -34,6 +35,8 @@ class UARTInterface:
         self.port = port
         self.baudRate = baudRate
         self._is_open = False
+        self.lastPacketArrivalNs: Optional[int] = None  # Monotonic clock
+        self.lastFrameNumber: Optional[int] = None  # Device frame counter
         print(f"UARTInterface initialized: port={port}, baudrate={baudRate}")
 
     def _ensure_open(self):
@@ -69,6 +72,10 @@ class UARTInterface:
         if self._is_open:  # Simple check if radar is supposed to be sending data
             # Generate some dummy bytes, e.g., a simple pattern
             dummy_packet_data = bytes([i % 256 for i in range(expected_bytes)])
+            self.lastPacketArrivalNs = time.monotonic_ns()
+            self.lastFrameNumber = (
+                0 if self.lastFrameNumber is None else self.lastFrameNumber + 1
+            )
             print(
                 f"UARTInterface (Data Port): Successfully read {len(dummy_packet_data)} dummy bytes."
             )
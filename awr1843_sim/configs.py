@@ -19,7 +19,6 @@ class ProfileConfig:
         self.rampSlopeMHzPerUsec = rampSlopeMHzPerUsec
         self.txPower = txPower
         self.rxGain = rxGain
-        print(f"ProfileConfig {profileId} created.")
 
     def toCommandString(self) -> str:
         # This is a simplified representation of what a CLI command might look like
@@ -50,7 +49,6 @@ class ChirpConfig:
         self.txEnable = txEnable
         self.idleTimeUsec = idleTimeUsec  # Often part of profile, but can be overridden
         self.adcStartTimeUsec = adcStartTimeUsec  # Same as above
-        print(f"ChirpConfig {chirpId} for profile {profileId} created.")
 
     def toCommandString(self) -> str:
         # Chirp config maps to 'chirpCfg' in TI's CLI
@@ -81,7 +79,6 @@ class FrameConfig:
         self.numFrames = numFrames
         self.triggerSelect = triggerSelect
         self.triggerDelayUsec = triggerDelayUsec
-        print(f"FrameConfig {frameId} created.")
 
     def toCommandString(self) -> str:
         # Frame config maps to 'frameCfg' in TI's CLI
@@ -1,13 +1,17 @@
 from typing import Optional
 from .communication_interfaces import UARTInterface
 from .data_place_holders import RawData
+from .tracing import LatencyTracer
 
 
 class DataAcquisition:
     def __init__(
-        self, radar_data_uart: UARTInterface
-    ):  # Assuming data comes over a UART
+        self,
+        radar_data_uart: UARTInterface,  # Assuming data comes over a UART
+        tracer: Optional[LatencyTracer] = None,
+    ):
         self._radar_data_uart = radar_data_uart
+        self._tracer = tracer
         self._is_capturing = False
         print("DataAcquisition module initialized.")
 
@@ -30,11 +34,21 @@ class DataAcquisition:
         # In a real system, you'd read from the data UART port until a full packet is received.
         # This often involves parsing a header to know the packet size.
         simulated_packet_size = 1024  # bytes, arbitrary for simulation
+        start_ns = LatencyTracer.now() if self._tracer else 0
         packet_bytes = self._radar_data_uart.readDataPortPacket(simulated_packet_size)
 
         if packet_bytes:
+            frame_number = self._radar_data_uart.lastFrameNumber
+            trace = None
+            if self._tracer:
+                arrival_ns = self._radar_data_uart.lastPacketArrivalNs
+                trace = self._tracer.newFrame(arrival_ns, deviceFrameNumber=frame_number)
+                # A packet that was already buffered arrived before this read started
+                read_end = max(start_ns, arrival_ns) if arrival_ns else LatencyTracer.now()
+                trace.addSpan("uart_read", start_ns, read_end)
+                trace.addSpan("capture_adc", start_ns, LatencyTracer.now())
             print(f"DataAcquisition: ADC data captured ({len(packet_bytes)} bytes).")
-            return RawData(packet_bytes)
+            return RawData(packet_bytes, trace, frameNumber=frame_number)
         else:
             print(
                 "DataAcquisition: Failed to capture ADC data (simulated timeout or error)."
@@ -1,23 +1,38 @@
 
-from typing import Any, List
+from typing import Any, List, Optional
+
+from .tracing import FrameTrace
 
 
 # --- Data placeholder classes (will need more definition later) ---
 class RawData:
-    def __init__(self, data: bytes):
+    def __init__(
+        self,
+        data: bytes,
+        trace: Optional[FrameTrace] = None,
+        frameNumber: Optional[int] = None,
+    ):
         self.data = data
+        self.trace = trace  # Frame id and stage timestamps, when tracing is on
+        self.frameNumber = frameNumber  # Device frame counter, for gap detection
         print(f"RawData created with {len(data)} bytes.")
 
 
 class PointCloud:
-    def __init__(self, points: List[Any]):  # Points could be tuples (x,y,z,vel)
+    def __init__(
+        self, points: List[Any], trace: Optional[FrameTrace] = None
+    ):  # Points could be tuples (x,y,z,vel)
         self.points = points
+        self.trace = trace
         print(f"PointCloud created with {len(points)} points.")
 
 
 class TargetList:
-    def __init__(self, targets: List[Any]):  # Targets could be objects with properties
+    def __init__(
+        self, targets: List[Any], trace: Optional[FrameTrace] = None
+    ):  # Targets could be objects with properties
         self.targets = targets
+        self.trace = trace
         print(f"TargetList created with {len(targets)} targets.")
 
 
@@ -1,11 +1,26 @@
+from typing import TYPE_CHECKING, Optional
+
+from .clustering import PointCloudClustering
 from .data_place_holders import PointCloud, RawData, TargetList
+from .tracing import LatencyTracer
+
+if TYPE_CHECKING:
+    # Needs NumPy; imported at first use so DataProcessing stays light
+    from .micro_doppler import MicroDopplerSTFT
 
 
 class DataProcessing:
-    def __init__(self):
+    def __init__(
+        self,
+        clustering: Optional[PointCloudClustering] = None,
+        microDoppler: Optional["MicroDopplerSTFT"] = None,
+    ):
+        self._clustering = clustering
+        self._micro_doppler = microDoppler
         print("DataProcessing module initialized.")
 
     def parseRaw(self, raw: RawData) -> PointCloud:
+        start_ns = LatencyTracer.now() if raw.trace else 0
         print(f"DataProcessing: Parsing RawData ({len(raw.data)} bytes)...")
         # Simulate parsing. This is where FFT, detection, etc., would happen.
         # For now, generate a dummy point cloud.
@@ -28,9 +43,12 @@ class DataProcessing:
         print(
             f"DataProcessing: RawData parsed into PointCloud with {num_points} points."
         )
-        return PointCloud(points)
+        if raw.trace:
+            raw.trace.addSpan("parse_raw", start_ns, LatencyTracer.now())
+        return PointCloud(points, raw.trace)
 
     def applyCFAR(self, pc: PointCloud) -> TargetList:
+        start_ns = LatencyTracer.now() if pc.trace else 0
         print(
             f"DataProcessing: Applying CFAR to PointCloud with {len(pc.points)} points..."
         )
@@ -47,4 +65,28 @@ class DataProcessing:
                     }
                 )
         print(f"DataProcessing: CFAR applied. {len(targets)} targets identified.")
-        return TargetList(targets)
+        if pc.trace:
+            pc.trace.addSpan("cfar", start_ns, LatencyTracer.now())
+        return TargetList(targets, pc.trace)
+
+    def clusterTargets(self, targets: TargetList) -> TargetList:
+        """Groups CFAR detections into one centroid target per object."""
+        start_ns = LatencyTracer.now() if targets.trace else 0
+        if self._clustering is None:
+            self._clustering = PointCloudClustering()
+        print(f"DataProcessing: Clustering {len(targets.targets)} CFAR detections...")
+        clustered = self._clustering.cluster(targets)
+        if targets.trace:
+            targets.trace.addSpan("clustering", start_ns, LatencyTracer.now())
+            clustered.trace = targets.trace
+        return clustered
+
+    def updateMicroDoppler(self, slowTime) -> "MicroDopplerSTFT":
+        """Feeds one frame of per-range-bin slow-time samples (rangeBins, chirps)."""
+        if self._micro_doppler is None:
+            from .micro_doppler import MicroDopplerSTFT
+
+            self._micro_doppler = MicroDopplerSTFT(numRangeBins=len(slowTime))
+        new_columns = self._micro_doppler.push(slowTime)
+        print(f"DataProcessing: Micro-Doppler updated with {new_columns} new columns.")
+        return self._micro_doppler
@@ -0,0 +1,548 @@
+import random
+import socket
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+
+from .communication_interfaces import UARTInterface
+
+# --- Device Emulator (socket-backed stand-in for the AWR1843 UARTs) ---
+
+# TI mmWave SDK output packet: magic word followed by a fixed-size frame header.
+MAGIC_WORD = b"\x02\x01\x04\x03\x06\x05\x08\x07"
+# version, totalPacketLen, platform, frameNumber, timeCpuCycles,
+# numDetectedObj, numTLVs, subFrameNumber
+FRAME_HEADER = struct.Struct("<8I")
+HEADER_LEN = len(MAGIC_WORD) + FRAME_HEADER.size
+# The emulator appends a CRC32 of header + payload so corruption can be detected.
+CRC_LEN = 4
+CLI_PROMPT = "mmwDemo:/>"
+SDK_VERSION = 0x03050004
+PLATFORM_AWR1843 = 0xA1843
+BITS_PER_BYTE = 10  # 8N1 framing: start bit + 8 data bits + stop bit
+
+
+class FaultConfig:
+    def __init__(
+        self,
+        latencySec: float = 0.0,  # Extra delay before every response/frame
+        jitterSec: float = 0.0,  # Uniform random jitter added on top of latency
+        partialReadProb: float = 0.0,  # Chance a frame is sent in stalled fragments
+        partialReadStallSec: float = 0.002,
+        dropBytesProb: float = 0.0,  # Chance a frame loses a run of bytes
+        maxDroppedBytes: int = 16,
+        crcErrorProb: float = 0.0,  # Chance a frame payload gets a flipped byte
+        dropFrameProb: float = 0.0,  # Chance a whole frame is never sent
+        seed: Optional[int] = None,
+    ):
+        self.latencySec = latencySec
+        self.jitterSec = jitterSec
+        self.partialReadProb = partialReadProb
+        self.partialReadStallSec = partialReadStallSec
+        self.dropBytesProb = dropBytesProb
+        self.maxDroppedBytes = maxDroppedBytes
+        self.crcErrorProb = crcErrorProb
+        self.dropFrameProb = dropFrameProb
+        self.seed = seed
+
+
+class _UartFifo:
+    """Bounded host-side receive FIFO; bytes that do not fit are lost (overrun).
+
+    Like a real UART, the sender never waits for the reader: a slow or idle
+    host shows up as dropped bytes, not as back-pressure on the device. Each
+    write is stamped with its arrival time, so the reader can tell when a byte
+    came off the wire rather than when it got around to reading it.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.overrunBytes = 0
+        self._buf = bytearray()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._bytes_accepted = 0
+        self._bytes_read = 0
+        # (stream offset just past a write, arrival time in monotonic ns)
+        self._arrivals: Deque[Tuple[int, int]] = deque()
+
+    def write(self, data: bytes) -> int:
+        """Queues ``data`` and returns the number of bytes lost to overrun."""
+        with self._cond:
+            room = self.capacity - len(self._buf)
+            accepted = data[: max(0, room)]
+            self._buf += accepted
+            dropped = len(data) - len(accepted)
+            self.overrunBytes += dropped
+            if accepted:
+                self._bytes_accepted += len(accepted)
+                self._arrivals.append((self._bytes_accepted, time.monotonic_ns()))
+                self._cond.notify_all()
+            return dropped
+
+    def read(self, maxBytes: int, timeoutSec: float) -> bytes:
+        """Returns up to ``maxBytes``, or b"" on timeout or once closed."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._buf or self._closed, timeoutSec)
+            out = bytes(self._buf[:maxBytes])
+            del self._buf[:maxBytes]
+            self._bytes_read += len(out)
+            # Keep stamps for bytes the reader may still hold unparsed
+            while self._arrivals and self._arrivals[0][0] < self._bytes_read - self.capacity:
+                self._arrivals.popleft()
+            return out
+
+    def arrivalNs(self, offset: int) -> int:
+        """Arrival time of the byte just before stream ``offset`` (bytes since open)."""
+        with self._cond:
+            while self._arrivals and self._arrivals[0][0] < offset:
+                self._arrivals.popleft()
+            return self._arrivals[0][1] if self._arrivals else time.monotonic_ns()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+def _write_throttled(
+    write: Callable[[bytes], Optional[int]], data: bytes, baudRate: int
+) -> int:
+    # Pace writes against a deadline so the link never beats the configured baud rate.
+    # Returns the number of bytes the receiving end dropped.
+    byte_time = BITS_PER_BYTE / baudRate
+    chunk = max(1, baudRate // (BITS_PER_BYTE * 1000))  # ~1 ms worth of bytes
+    deadline = time.monotonic()
+    dropped = 0
+    for offset in range(0, len(data), chunk):
+        piece = data[offset : offset + chunk]
+        deadline += len(piece) * byte_time
+        dropped += write(piece) or 0
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    return dropped
+
+
+class AWR1843DeviceEmulator:
+    """Emulates the AWR1843 CLI and data ports over local socket pairs.
+
+    The CLI channel answers commands the way the mmWave SDK demo does (echo,
+    status line, prompt). After ``sensorStart`` the data channel streams one
+    framed packet per ``frameCfg`` period until ``sensorStop``. Both channels
+    are throttled to the baud rate of the interface that connects to them and
+    pass through the configured ``FaultConfig``.
+
+    The frame clock does not depend on the reader: data goes into a bounded
+    receive FIFO of ``rxBufferBytes`` and overflow is counted in
+    ``overrunBytes``/``framesOverrun``. Frame slots missed because the link was
+    still busy with a previous packet are counted in ``framesSkipped``.
+    """
+
+    KNOWN_COMMANDS = {
+        "sensorStart",
+        "sensorStop",
+        "flushCfg",
+        "dfeDataOutputMode",
+        "channelCfg",
+        "adcCfg",
+        "adcbufCfg",
+        "profileCfg",
+        "chirpCfg",
+        "frameCfg",
+        "lowPower",
+        "guiMonitor",
+        "cfarCfg",
+        "calibDcRangeSigCfg",
+        "version",
+    }
+
+    def __init__(
+        self,
+        faults: Optional[FaultConfig] = None,
+        payloadBytes: int = 1024,
+        framePeriodSec: float = 0.05,
+        firmwareVersion: str = "AWR18xx MMW Demo 03.05.00.04",
+        rxBufferBytes: int = 65536,  # Host-side data-port receive buffer
+    ):
+        self.faults = faults or FaultConfig()
+        self.payloadBytes = payloadBytes
+        self.framePeriodSec = framePeriodSec
+        self.firmwareVersion = firmwareVersion
+        self.rxBufferBytes = rxBufferBytes
+        self._rng = random.Random(self.faults.seed)
+        self._cli_host: Optional[socket.socket] = None
+        self._cli_device: Optional[socket.socket] = None
+        self._data_fifo: Optional[_UartFifo] = None
+        self._baud: Dict[str, int] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._stop_events: Dict[str, threading.Event] = {}
+        self._streaming = threading.Event()
+        # CLI configuration state, enforced like the mmWave SDK demo does
+        self._profile_ids = set()
+        self._frame_configured = False
+        self._config_applied = False  # A full sensorStart has consumed the config
+        self._frame_number = 0
+        self.framesSent = 0
+        self.framesDropped = 0  # Injected by dropFrameProb
+        self.framesSkipped = 0  # Link still busy when the frame was due
+        self.framesOverrun = 0  # Frames that lost bytes to a full receive FIFO
+        self.overrunBytes = 0
+        print(
+            f"AWR1843DeviceEmulator initialized: payload={payloadBytes} bytes, "
+            f"period={framePeriodSec * 1000:.1f} ms"
+        )
+
+    def connect(self, channel: str, baudRate: int) -> Union[socket.socket, _UartFifo]:
+        """Returns the host end of ``channel``, starting it if needed.
+
+        The "cli" channel is a socket; the "data" channel is a ``_UartFifo``.
+        """
+        if channel not in ("cli", "data"):
+            raise ValueError(f"Unknown emulator channel: {channel}")
+        if channel in self._threads:
+            return self._cli_host if channel == "cli" else self._data_fifo
+        if channel == "cli":
+            self._cli_host, self._cli_device = socket.socketpair()
+            target = self._serve_cli
+        else:
+            self._data_fifo = _UartFifo(self.rxBufferBytes)
+            target = self._serve_data
+        self._baud[channel] = baudRate
+        stop = threading.Event()
+        self._stop_events[channel] = stop
+        thread = threading.Thread(
+            target=target, args=(stop,), name=f"awr1843-emu-{channel}", daemon=True
+        )
+        self._threads[channel] = thread
+        thread.start()
+        print(f"AWR1843DeviceEmulator: {channel} channel up at {baudRate} baud.")
+        return self._cli_host if channel == "cli" else self._data_fifo
+
+    def disconnect(self, channel: str) -> None:
+        thread = self._threads.pop(channel, None)
+        if thread is None:
+            return
+        self._stop_events.pop(channel).set()
+        if channel == "cli":
+            for sock in (self._cli_host, self._cli_device):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
+            self._cli_host = self._cli_device = None
+        else:
+            self._streaming.clear()
+            self._data_fifo.close()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        print(f"AWR1843DeviceEmulator: {channel} channel down.")
+
+    def stop(self) -> None:
+        for channel in list(self._threads):
+            self.disconnect(channel)
+
+    def _fault_delay(self) -> None:
+        delay = self.faults.latencySec
+        if self.faults.jitterSec > 0:
+            delay += self._rng.uniform(0.0, self.faults.jitterSec)
+        if delay > 0:
+            time.sleep(delay)
+
+    # --- CLI channel ---
+
+    def _serve_cli(self, stop: threading.Event) -> None:
+        sock = self._cli_device
+        sock.settimeout(0.1)
+        buffer = b""
+        while not stop.is_set():
+            try:
+                chunk = sock.recv(1024)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            if not chunk:
+                break
+            buffer += chunk
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                cmd = line.decode("ascii", errors="replace").strip()
+                if not cmd:
+                    continue
+                reply = self._handle_command(cmd)
+                self._fault_delay()
+                try:
+                    _write_throttled(
+                        sock.sendall,
+                        f"{cmd}\n{reply}\n{CLI_PROMPT}".encode(),
+                        self._baud["cli"],
+                    )
+                except OSError:
+                    return
+
+    def _handle_command(self, cmd: str) -> str:
+        parts = cmd.split()
+        name = parts[0]
+        if name not in self.KNOWN_COMMANDS:
+            return f"'{name}' is not recognized as a CLI command"
+        if name == "version":
+            return f"Platform: AWR18xx\n{self.firmwareVersion}\nDone"
+        if name == "sensorStop":
+            self._streaming.clear()
+            return "Done"
+        if self._streaming.is_set() and name not in ("sensorStart", "guiMonitor"):
+            return "Error: sensor is running, issue sensorStop first"
+        if name == "flushCfg":
+            self._profile_ids.clear()
+            self._frame_configured = False
+            self._config_applied = False
+        elif name == "profileCfg":
+            # The firmware rejects re-adding a profile until flushCfg
+            try:
+                profile_id = int(parts[1])
+            except (IndexError, ValueError):
+                return "Error -1"
+            if profile_id in self._profile_ids:
+                return "Error -1"
+            self._profile_ids.add(profile_id)
+        elif name == "frameCfg":
+            # frameCfg <start> <end> <loops> <frames> <periodMs> <trigger> <delay>
+            try:
+                self.framePeriodSec = float(parts[5]) / 1000.0
+            except (IndexError, ValueError):
+                return "Error -1"
+            self._frame_configured = True
+        elif name == "sensorStart":
+            # sensorStart [doReconfig]; 0 restarts with the already applied config
+            reconfigure = len(parts) < 2 or parts[1] != "0"
+            if reconfigure and not self._frame_configured:
+                return "Error -1"
+            if not reconfigure and not self._config_applied:
+                return "Error -1"
+            self._config_applied = True
+            self._streaming.set()
+        return "Done"
+
+    # --- Data channel ---
+
+    def _build_packet(self) -> bytes:
+        payload = bytes(
+            (self._frame_number + i) % 256 for i in range(self.payloadBytes)
+        )
+        total_len = HEADER_LEN + len(payload) + CRC_LEN
+        header = MAGIC_WORD + FRAME_HEADER.pack(
+            SDK_VERSION,
+            total_len,
+            PLATFORM_AWR1843,
+            self._frame_number,
+            int(time.monotonic() * 200e6) & 0xFFFFFFFF,  # 200 MHz R4F cycle counter
+            0,
+            1,
+            0,
+        )
+        body = header + payload
+        return body + struct.pack("<I", zlib.crc32(body))
+
+    def _apply_packet_faults(self, packet: bytes) -> bytes:
+        if self.faults.crcErrorProb and self._rng.random() < self.faults.crcErrorProb:
+            idx = self._rng.randrange(HEADER_LEN, len(packet) - CRC_LEN)
+            corrupted = bytearray(packet)
+            corrupted[idx] ^= 0xFF
+            packet = bytes(corrupted)
+        if self.faults.dropBytesProb and self._rng.random() < self.faults.dropBytesProb:
+            count = self._rng.randint(1, max(1, self.faults.maxDroppedBytes))
+            start = self._rng.randrange(0, max(1, len(packet) - count))
+            packet = packet[:start] + packet[start + count :]
+        return packet
+
+    def _serve_data(self, stop: threading.Event) -> None:
+        fifo = self._data_fifo
+        baud = self._baud["data"]
+        next_frame = time.monotonic()
+        while not stop.is_set():
+            if not self._streaming.wait(timeout=0.1):
+                next_frame = time.monotonic()
+                continue
+            delay = next_frame - time.monotonic()
+            if delay > 0 and stop.wait(delay):
+                return
+            next_frame += self.framePeriodSec
+            packet = self._build_packet()
+            self._frame_number = (self._frame_number + 1) & 0xFFFFFFFF
+            if self.faults.dropFrameProb and self._rng.random() < self.faults.dropFrameProb:
+                self.framesDropped += 1
+                continue
+            packet = self._apply_packet_faults(packet)
+            self._fault_delay()
+            if (
+                self.faults.partialReadProb
+                and self._rng.random() < self.faults.partialReadProb
+            ):
+                cut = self._rng.randrange(1, len(packet))
+                dropped = _write_throttled(fifo.write, packet[:cut], baud)
+                time.sleep(self.faults.partialReadStallSec)
+                dropped += _write_throttled(fifo.write, packet[cut:], baud)
+            else:
+                dropped = _write_throttled(fifo.write, packet, baud)
+            self.framesSent += 1
+            if dropped:
+                self.framesOverrun += 1
+                self.overrunBytes += dropped
+            # The sensor keeps framing while the link is busy; those frames are lost
+            now = time.monotonic()
+            while next_frame + self.framePeriodSec <= now:
+                next_frame += self.framePeriodSec
+                self._frame_number = (self._frame_number + 1) & 0xFFFFFFFF
+                self.framesSkipped += 1
+
+
+class EmulatedUARTInterface(UARTInterface):
+    """Drop-in ``UARTInterface`` that talks to an ``AWR1843DeviceEmulator`` channel."""
+
+    def __init__(
+        self,
+        port: str,
+        baudRate: int,
+        emulator: AWR1843DeviceEmulator,
+        channel: str = "cli",
+    ):
+        super().__init__(port, baudRate)
+        self._emulator = emulator
+        self._channel = channel
+        self._sock: Optional[socket.socket] = None  # CLI channel
+        self._fifo: Optional[_UartFifo] = None  # Data channel
+        self._rx = bytearray()
+        self._rx_end_offset = 0  # Data-channel stream offset just past self._rx
+        # Link statistics, for throughput and loss measurements
+        self.bytesRead = 0
+        self.packetsRead = 0
+        self.crcErrors = 0
+        self.timeouts = 0
+        self.bytesDiscarded = 0
+
+    def _ensure_open(self):
+        if not self._is_open:
+            link = self._emulator.connect(self._channel, self.baudRate)
+            if self._channel == "data":
+                self._fifo = link
+            else:
+                self._sock = link
+            self._rx.clear()
+            self._rx_end_offset = 0
+            self._is_open = True
+            print(f"UARTInterface: Port {self.port} opened (emulated {self._channel}).")
+
+    def _recv_into_buffer(self, deadline: float) -> bool:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if self._fifo is not None:
+            chunk = self._fifo.read(4096, remaining)
+        else:
+            self._sock.settimeout(remaining)
+            try:
+                chunk = self._sock.recv(4096)
+            except socket.timeout:
+                return False
+        if not chunk:
+            return False
+        self._rx += chunk
+        self._rx_end_offset += len(chunk)
+        self.bytesRead += len(chunk)
+        return True
+
+    def sendCommand(self, cmd: str) -> None:
+        self._ensure_open()
+        print(f"UARTInterface: Sending command: '{cmd}'")
+        _write_throttled(self._sock.sendall, cmd.encode("ascii") + b"\n", self.baudRate)
+
+    def readResponse(self, timeout_sec: float = 1.0) -> str:
+        self._ensure_open()
+        deadline = time.monotonic() + timeout_sec
+        prompt = CLI_PROMPT.encode()
+        while prompt not in self._rx:
+            if not self._recv_into_buffer(deadline):
+                self.timeouts += 1
+                print(f"UARTInterface: Timed out waiting for response on {self.port}.")
+                return ""
+        end = self._rx.index(prompt)
+        text = self._rx[:end].decode("ascii", errors="replace")
+        del self._rx[: end + len(prompt)]
+        # First line is the echoed command; the rest is the device's reply
+        lines = [line for line in text.splitlines() if line.strip()]
+        response = "\n".join(lines[1:])
+        print(f"UARTInterface: Reading response: '{response}'")
+        return response
+
+    def readDataPortPacket(
+        self, expected_bytes: int, timeout_sec: float = 2.0
+    ) -> Optional[bytes]:
+        """Reads one framed packet from the emulated data port and returns its payload."""
+        self._ensure_open()
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            # Resynchronize on the magic word, discarding anything before it
+            idx = self._rx.find(MAGIC_WORD)
+            if idx < 0:
+                keep = len(MAGIC_WORD) - 1
+                if len(self._rx) > keep:
+                    self.bytesDiscarded += len(self._rx) - keep
+                    del self._rx[: len(self._rx) - keep]
+            elif idx > 0:
+                self.bytesDiscarded += idx
+                del self._rx[:idx]
+            if idx >= 0 and len(self._rx) >= HEADER_LEN:
+                fields = FRAME_HEADER.unpack_from(self._rx, len(MAGIC_WORD))
+                total_len, frame_number = fields[1], fields[3]
+                if total_len < HEADER_LEN + CRC_LEN:
+                    self.bytesDiscarded += len(MAGIC_WORD)
+                    del self._rx[: len(MAGIC_WORD)]
+                    continue
+                if len(self._rx) >= total_len:
+                    packet = bytes(self._rx[:total_len])
+                    (crc,) = struct.unpack_from("<I", packet, total_len - CRC_LEN)
+                    if zlib.crc32(packet[: total_len - CRC_LEN]) != crc:
+                        # Corrupt or truncated: skip this magic word and rescan
+                        self.crcErrors += 1
+                        self.bytesDiscarded += len(MAGIC_WORD)
+                        del self._rx[: len(MAGIC_WORD)]
+                        print(
+                            f"UARTInterface (Data Port): CRC mismatch on frame {frame_number}, dropping."
+                        )
+                        continue
+                    # Time the last byte reached the host, not when we parsed it
+                    end_offset = self._rx_end_offset - len(self._rx) + total_len
+                    self.lastPacketArrivalNs = (
+                        self._fifo.arrivalNs(end_offset)
+                        if self._fifo is not None
+                        else time.monotonic_ns()
+                    )
+                    del self._rx[:total_len]
+                    payload = packet[HEADER_LEN : total_len - CRC_LEN]
+                    self.packetsRead += 1
+                    self.lastFrameNumber = frame_number
+                    if len(payload) != expected_bytes:
+                        print(
+                            f"UARTInterface (Data Port): Expected {expected_bytes} bytes, "
+                            f"frame {frame_number} carried {len(payload)}."
+                        )
+                    return payload
+            if not self._recv_into_buffer(deadline):
+                self.timeouts += 1
+                print(
+                    "UARTInterface (Data Port): Failed to read (timed out waiting for a full packet)."
+                )
+                return None
+
+    def close(self):
+        if self._is_open:
+            self._emulator.disconnect(self._channel)
+            self._sock = None
+            self._fifo = None
+            self._is_open = False
+            print(f"UARTInterface: Port {self.port} closed.")
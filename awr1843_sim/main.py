@@ -6,6 +6,7 @@ from .configs import ChirpConfig, FrameConfig, ProfileConfig
 from .data_acquisition import DataAcquisition
 from .data_place_holders import RawData
 from .data_processing import DataProcessing
+from .tracing import LatencyTracer
 
 
 # --- Main Radar Class ---
@@ -17,17 +18,30 @@ class AWR1843Radar:
         uart_port: str = "/dev/ttyUSB0",
         uart_baud: int = 115200,
         data_uart_port: str = "/dev/ttyUSB1",
-        data_uart_baud: int = 921600,
-    ):  # Common for data
-        # Initialize interfaces
-        self.spiInterface = SPIInterface(mode=spi_mode, speedHz=spi_speed)
-        self.uartInterface = UARTInterface(port=uart_port, baudRate=uart_baud)
-        # TI devices often use a separate UART for configuration and data
-        # For simulation simplicity, we can reuse UARTInterface or create a distinct one if needed.
-        # Let's assume data comes over a separate logical channel, handled by DataAcquisition
-        self.dataUartInterface = UARTInterface(
-            port=data_uart_port, baudRate=data_uart_baud
-        )
+        data_uart_baud: int = 921600,  # Common for data
+        uart_interface: Optional[UARTInterface] = None,
+        data_uart_interface: Optional[UARTInterface] = None,
+        tracer: Optional[LatencyTracer] = None,  # Per-frame latency tracing
+        data_acquisition_module: Optional[DataAcquisition] = None,
+        data_processing_module: Optional[DataProcessing] = None,
+    ):
+        # Interfaces and functional components are created on first use so that
+        # constructing a radar (e.g. in a short-lived worker) stays cheap.
+        self._spi_mode = spi_mode
+        self._spi_speed = spi_speed
+        self._uart_port = uart_port
+        self._uart_baud = uart_baud
+        self._data_uart_port = data_uart_port
+        self._data_uart_baud = data_uart_baud
+        # Callers may plug in their own interfaces (e.g. EmulatedUARTInterface)
+        # and modules, here or later through the property setters
+        self._spi_interface: Optional[SPIInterface] = None
+        self._uart_interface = uart_interface
+        self._data_uart_interface = data_uart_interface
+        self._calibration_module: Optional[Calibration] = None
+        self._data_acquisition_module = data_acquisition_module
+        self._data_processing_module = data_processing_module
+        self.tracer = tracer
 
         # Configuration storage
         self.profileConfig: Optional[ProfileConfig] = None
@@ -40,15 +54,81 @@ class AWR1843Radar:
         self._initialized: bool = False
         self._capturing: bool = False
 
-        # Functional components
-        self.calibration_module = Calibration(self.uartInterface)
-        self.data_acquisition_module = DataAcquisition(
-            self.dataUartInterface
-        )  # Pass the data UART
-        self.data_processing_module = DataProcessing()
-
         print("AWR1843Radar instance created.")
 
+    # --- Lazily constructed interfaces and modules ---
+
+    @property
+    def spiInterface(self) -> SPIInterface:
+        if self._spi_interface is None:
+            self._spi_interface = SPIInterface(
+                mode=self._spi_mode, speedHz=self._spi_speed
+            )
+        return self._spi_interface
+
+    @spiInterface.setter
+    def spiInterface(self, value: SPIInterface) -> None:
+        self._spi_interface = value
+
+    @property
+    def uartInterface(self) -> UARTInterface:
+        if self._uart_interface is None:
+            self._uart_interface = UARTInterface(
+                port=self._uart_port, baudRate=self._uart_baud
+            )
+        return self._uart_interface
+
+    @uartInterface.setter
+    def uartInterface(self, value: UARTInterface) -> None:
+        self._uart_interface = value
+
+    @property
+    def dataUartInterface(self) -> UARTInterface:
+        # TI devices often use a separate UART for configuration and data
+        # Let's assume data comes over a separate logical channel, handled by DataAcquisition
+        if self._data_uart_interface is None:
+            self._data_uart_interface = UARTInterface(
+                port=self._data_uart_port, baudRate=self._data_uart_baud
+            )
+        return self._data_uart_interface
+
+    @dataUartInterface.setter
+    def dataUartInterface(self, value: UARTInterface) -> None:
+        self._data_uart_interface = value
+
+    @property
+    def calibration_module(self) -> Calibration:
+        if self._calibration_module is None:
+            self._calibration_module = Calibration(self.uartInterface)
+        return self._calibration_module
+
+    @calibration_module.setter
+    def calibration_module(self, value: Calibration) -> None:
+        self._calibration_module = value
+
+    @property
+    def data_acquisition_module(self) -> DataAcquisition:
+        if self._data_acquisition_module is None:
+            # Pass the data UART
+            self._data_acquisition_module = DataAcquisition(
+                self.dataUartInterface, tracer=self.tracer
+            )
+        return self._data_acquisition_module
+
+    @data_acquisition_module.setter
+    def data_acquisition_module(self, value: DataAcquisition) -> None:
+        self._data_acquisition_module = value
+
+    @property
+    def data_processing_module(self) -> DataProcessing:
+        if self._data_processing_module is None:
+            self._data_processing_module = DataProcessing()
+        return self._data_processing_module
+
+    @data_processing_module.setter
+    def data_processing_module(self, value: DataProcessing) -> None:
+        self._data_processing_module = value
+
     def _send_config_command(self, command: str) -> bool:
         self.uartInterface.sendCommand(command)
         response = self.uartInterface.readResponse()
@@ -180,7 +260,9 @@ class AWR1843Radar:
             print("AWR1843Radar: Calibration failed.")
             return False
 
-    def startCapture(self) -> bool:
+    def startCapture(self, reconfigure: bool = True) -> bool:
+        # reconfigure=False sends "sensorStart 0": restart with the config and
+        # calibration the firmware already holds
         if not self._initialized:
             print("AWR1843Radar: Cannot start capture. Radar not initialized.")
             return False
@@ -191,7 +273,7 @@ class AWR1843Radar:
         #     print("AWR1843Radar: Warning - starting capture without calibration.")
 
         print("AWR1843Radar: Starting capture...")
-        if self._send_config_command("sensorStart"):
+        if self._send_config_command("sensorStart" if reconfigure else "sensorStart 0"):
             self._capturing = True
             self.data_acquisition_module.start()
             print("AWR1843Radar: Capture started.")
@@ -218,20 +300,75 @@ class AWR1843Radar:
             print("AWR1843Radar: Not capturing. Cannot read data.")
             return None
         print("AWR1843Radar: Reading data...")
+        start_ns = LatencyTracer.now() if self.tracer else 0
         raw_data = self.data_acquisition_module.captureADC()
+        if raw_data and raw_data.trace:
+            raw_data.trace.addSpan("read_data", start_ns, LatencyTracer.now())
         if raw_data:
             print("AWR1843Radar: Data read successfully.")
         else:
             print("AWR1843Radar: Failed to read data.")
         return raw_data
 
+    def recoverCapture(self) -> bool:
+        """Restarts a stalled capture without a powerOff/powerOn cycle.
+
+        Fast path: ``sensorStop`` then ``sensorStart 0``, which keeps the
+        configuration and calibration already loaded in the firmware. If that
+        is rejected, falls back to ``flushCfg``, replays the calibration
+        commands, re-sends the cached last-good profile, chirp and frame
+        configs and does a full ``sensorStart``. If the calibration cannot be
+        replayed, the radar is left running but marked uncalibrated.
+        """
+        if not self._initialized:
+            print("AWR1843Radar: Cannot recover. Radar not initialized.")
+            return False
+        if not self.frameConfig:
+            print("AWR1843Radar: Cannot recover. Frame not configured.")
+            return False
+        print("AWR1843Radar: Recovering capture...")
+        if self._capturing:
+            self.stopCapture()
+        if self.startCapture(reconfigure=False):
+            print("AWR1843Radar: Capture recovered (config retained).")
+            return True
+
+        print("AWR1843Radar: Restart without reconfig failed, re-sending configuration...")
+        if not (self.profileConfig and self.chirpConfigs):
+            print("AWR1843Radar: Cannot recover. No cached configuration.")
+            return False
+        if not self._send_config_command("flushCfg"):
+            print("AWR1843Radar: Recovery failed while flushing configuration.")
+            return False
+        # flushCfg also drops the calibration config, so replay it or stop claiming it
+        if self.calibrated and not self.calibration_module.replayCalibCommands():
+            self.calibrated = False
+            print("AWR1843Radar: Calibration lost during recovery, marked uncalibrated.")
+        commands = [self.profileConfig.toCommandString()]
+        commands += [c.toCommandString() for c in self.chirpConfigs]
+        commands.append(self.frameConfig.toCommandString())
+        for command in commands:
+            if not self._send_config_command(command):
+                print("AWR1843Radar: Recovery failed while re-sending configuration.")
+                return False
+        if not self.startCapture():
+            print("AWR1843Radar: Recovery failed to restart capture.")
+            return False
+        print("AWR1843Radar: Capture recovered (config re-sent).")
+        return True
+
     def powerOff(self):
         print("AWR1843Radar: Powering OFF...")
         if self._capturing:
             self.stopCapture()
-        self.uartInterface.close()
-        self.dataUartInterface.close()
-        self.spiInterface.close()
+        # Only close interfaces that were actually created
+        for interface in (
+            self._uart_interface,
+            self._data_uart_interface,
+            self._spi_interface,
+        ):
+            if interface is not None:
+                interface.close()
         self._powered_on = False
         self._initialized = False
         self.calibrated = False
@@ -0,0 +1,117 @@
+from typing import Optional
+
+import numpy as np
+
+# --- Streaming micro-Doppler spectrogram (overlapping STFT) ---
+
+
+class MicroDopplerSTFT:
+    """Rolling micro-Doppler spectrogram per range bin from slow-time samples.
+
+    Incoming chirps go into a doubled ring buffer, so the newest ``windowLen``
+    samples of every range bin are always one contiguous slice. Each time
+    ``hop`` new chirps have arrived, only the newest STFT column is computed,
+    reusing the precomputed window and scratch buffers. Columns land in a
+    doubled ring of ``historyColumns``, so ``spectrogram`` can return a
+    chronologically ordered read-only view without copying.
+    """
+
+    def __init__(
+        self,
+        numRangeBins: int,
+        windowLen: int = 128,  # Chirps per STFT segment
+        hop: int = 16,  # New chirps between columns (overlap = windowLen - hop)
+        historyColumns: int = 256,  # Spectrogram length kept for classifiers
+        logScale: bool = True,  # Store 20*log10 magnitude instead of linear
+    ):
+        if not 0 < hop <= windowLen:
+            raise ValueError("hop must be in (0, windowLen]")
+        self.numRangeBins = numRangeBins
+        self.windowLen = windowLen
+        self.hop = hop
+        self.historyColumns = historyColumns
+        self.logScale = logScale
+        self._window = np.hanning(windowLen).astype(np.float32)
+        # Slow-time ring, written twice so [pos, pos + windowLen) is the latest segment
+        self._samples = np.zeros((numRangeBins, 2 * windowLen), dtype=np.complex64)
+        self._sample_pos = 0
+        self._samples_seen = 0
+        self._since_last_column = 0
+        self._scratch = np.empty((numRangeBins, windowLen), dtype=np.complex64)
+        # Spectrogram ring: (range bin, doppler bin, time), also written twice
+        self._spec = np.zeros(
+            (numRangeBins, windowLen, 2 * historyColumns), dtype=np.float32
+        )
+        self.columnsComputed = 0
+        print(
+            f"MicroDopplerSTFT initialized: {numRangeBins} range bins, "
+            f"window={windowLen}, hop={hop}, history={historyColumns} columns"
+        )
+
+    def _append_samples(self, block) -> None:
+        n = block.shape[1]
+        idx = (self._sample_pos + np.arange(n)) % self.windowLen
+        self._samples[:, idx] = block
+        self._samples[:, idx + self.windowLen] = block
+        self._sample_pos = (self._sample_pos + n) % self.windowLen
+        self._samples_seen += n
+
+    def _compute_column(self) -> None:
+        segment = self._samples[:, self._sample_pos : self._sample_pos + self.windowLen]
+        np.multiply(segment, self._window, out=self._scratch)
+        spectrum = np.fft.fftshift(np.fft.fft(self._scratch, axis=1), axes=1)
+        magnitude = np.abs(spectrum)
+        if self.logScale:
+            magnitude = 20 * np.log10(magnitude + 1e-12)
+        col = self.columnsComputed % self.historyColumns
+        self._spec[:, :, col] = magnitude
+        self._spec[:, :, col + self.historyColumns] = magnitude
+        self.columnsComputed += 1
+
+    def push(self, slowTime) -> int:
+        """Adds chirps shaped (numRangeBins, numChirps); returns new column count."""
+        slowTime = np.asarray(slowTime)
+        if slowTime.ndim != 2 or slowTime.shape[0] != self.numRangeBins:
+            raise ValueError(
+                f"Expected ({self.numRangeBins}, numChirps) samples, got {slowTime.shape}"
+            )
+        before = self.columnsComputed
+        offset = 0
+        total = slowTime.shape[1]
+        while offset < total:
+            # Feed up to the next hop boundary so each column sees exactly its segment
+            take = min(self.hop - self._since_last_column, total - offset)
+            self._append_samples(slowTime[:, offset : offset + take])
+            offset += take
+            self._since_last_column += take
+            if self._since_last_column == self.hop:
+                self._since_last_column = 0
+                if self._samples_seen >= self.windowLen:
+                    self._compute_column()
+        return self.columnsComputed - before
+
+    def spectrogram(self, rangeBin: Optional[int] = None):
+        """Read-only view of the rolling spectrogram, oldest column first.
+
+        Shaped (dopplerBins, time) for one range bin or (rangeBins, dopplerBins,
+        time) for all of them. Before ``historyColumns`` columns exist, only the
+        computed ones are included. The view is overwritten by later ``push``
+        calls; copy it if it must outlive the next frame.
+        """
+        filled = min(self.columnsComputed, self.historyColumns)
+        start = self.columnsComputed % self.historyColumns
+        if filled < self.historyColumns:
+            start = 0
+        view = self._spec[:, :, start : start + filled]
+        if rangeBin is not None:
+            view = view[rangeBin]
+        view.flags.writeable = False
+        return view
+
+    def reset(self) -> None:
+        self._samples.fill(0)
+        self._spec.fill(0)
+        self._sample_pos = 0
+        self._samples_seen = 0
+        self._since_last_column = 0
+        self.columnsComputed = 0
@@ -1,6 +1,7 @@
 # --- Example Usage ---
 from .configs import ChirpConfig, FrameConfig, ProfileConfig
 from .main import AWR1843Radar
+from .watchdog import CaptureWatchdog
 
 if __name__ == "__main__":
     print("--- AWR1843 Radar Simulation Start ---")
@@ -72,10 +73,11 @@ if __name__ == "__main__":
         radar.powerOff()
         exit()
 
-    # Read a few frames of data (simulated)
+    # Read a few frames of data (simulated); the watchdog restarts a stalled capture
+    watchdog = CaptureWatchdog(radar)
     for i in range(3):
         print(f"\n--- Reading Frame {i+1} ---")
-        raw_frame_data = radar.readData()
+        raw_frame_data = watchdog.readFrame()
         if raw_frame_data:
             print(f"Received RawData with {len(raw_frame_data.data)} bytes.")
             # Process the data
@@ -86,13 +88,18 @@ if __name__ == "__main__":
                 )
                 targets = radar.data_processing_module.applyCFAR(point_cloud)
                 print(f"CFAR resulted in {len(targets.targets)} targets.")
-                if targets.targets:
-                    print(f"First target (simulated): {targets.targets[0]}")
+                objects = radar.data_processing_module.clusterTargets(targets)
+                print(f"Clustering resulted in {len(objects.targets)} objects.")
+                if objects.targets:
+                    print(f"First object (simulated): {objects.targets[0]}")
             else:
                 print("No points in point cloud after parsing.")
         else:
             print("Failed to read data for this frame.")
-            break  # Stop if data read fails
+            if not watchdog.healthy:
+                break  # Stop only once recovery has been given up
+
+    print(f"Watchdog metrics: {watchdog.metrics.summary()}")
 
     # Stop capture and power off
     radar.stopCapture()
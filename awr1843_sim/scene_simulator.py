@@ -0,0 +1,288 @@
+import math
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# --- Multi-subject vital-sign scene simulator ---
+
+SPEED_OF_LIGHT = 3e8
+NOISE_BLOCK_CHIRPS = 64  # Receiver noise is seeded per block of this many chirps
+
+
+class Subject:
+    def __init__(
+        self,
+        rangeM: float,
+        angleDeg: float = 0.0,  # Azimuth, 0 is boresight
+        respRateBpm: float = 15.0,
+        heartRateBpm: float = 70.0,
+        respAmpM: float = 7e-3,  # Chest displacement from breathing
+        heartAmpM: float = 0.5e-3,  # Chest displacement from heartbeat
+        rcs: float = 1.0,  # Relative reflectivity
+    ):
+        self.rangeM = rangeM
+        self.angleDeg = angleDeg
+        self.respRateBpm = respRateBpm
+        self.heartRateBpm = heartRateBpm
+        self.respAmpM = respAmpM
+        self.heartAmpM = heartAmpM
+        self.rcs = rcs
+
+
+class VitalSignScene:
+    """One simulated scenario: ground truth plus lazily generated IQ chunks.
+
+    Every reflector (each subject's direct path and its multipath ghosts) has a
+    precomputed range track over slow time. ``iterChunks`` turns a block of
+    chirps for all reflectors and antennas into ADC samples with one batched
+    tensor computation, so memory stays bounded by the chunk size.
+    """
+
+    def __init__(
+        self,
+        simulator: "SceneSimulator",
+        subjects: List[Subject],
+        seed: int,
+        slowTime,  # (numChirps,) seconds
+        displacement,  # (numSubjects, numChirps) metres
+        respBpm,  # (numSubjects, numChirps)
+        heartBpm,  # (numSubjects, numChirps)
+        reflectorRanges,  # (numReflectors, numChirps) metres
+        reflectorAngles,  # (numReflectors,) radians
+        reflectorAmps,  # (numReflectors,)
+        reflectorSubject,  # (numReflectors,) owning subject index
+    ):
+        self.simulator = simulator
+        self.subjects = subjects
+        self.seed = seed
+        self.slowTime = slowTime
+        self.displacement = displacement
+        self.respBpm = respBpm
+        self.heartBpm = heartBpm
+        self.reflectorRanges = reflectorRanges
+        self.reflectorAngles = reflectorAngles
+        self.reflectorAmps = reflectorAmps
+        self.reflectorSubject = reflectorSubject
+
+    @property
+    def numChirps(self) -> int:
+        return self.slowTime.shape[0]
+
+    def iterChunks(self, chunkChirps: int = 256) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yields ``(firstChirp, iq)`` with ``iq`` shaped (chirps, antennas, samples).
+
+        Receiver noise for each fixed block of ``NOISE_BLOCK_CHIRPS`` chirps
+        comes from a generator seeded with the scene seed and the block index,
+        so the samples depend only on the chirp index, not on ``chunkChirps``.
+        """
+        sim = self.simulator
+        noise_blocks = {}  # Block index -> noise, for blocks a chunk boundary splits
+        t_fast = np.arange(sim.numSamples) / sim.sampleRateHz
+        beat_per_m = 2 * np.pi * 2 * sim.slopeHzPerSec / SPEED_OF_LIGHT
+        carrier_per_m = 4 * np.pi / sim.wavelength
+        # Uniform linear array with half-wavelength spacing
+        steering = np.exp(
+            1j
+            * np.pi
+            * np.sin(self.reflectorAngles)[:, None]
+            * np.arange(sim.numRx)[None, :]
+        )  # (P, A)
+        amps = self.reflectorAmps[:, None]
+        for start in range(0, self.numChirps, chunkChirps):
+            ranges = self.reflectorRanges[:, start : start + chunkChirps]  # (P, C)
+            fast = np.exp(1j * beat_per_m * ranges[:, :, None] * t_fast)  # (P, C, N)
+            carrier = amps * np.exp(1j * carrier_per_m * ranges)  # (P, C)
+            iq = np.einsum("pc,pa,pcn->can", carrier, steering, fast, optimize=True)
+            if sim.noiseStd > 0:
+                stop = start + iq.shape[0]
+                first, last = start // NOISE_BLOCK_CHIRPS, (stop - 1) // NOISE_BLOCK_CHIRPS
+                parts = []
+                for block in range(first, last + 1):
+                    if block not in noise_blocks:
+                        noise_blocks[block] = self._noise_block(block, iq.shape[1:])
+                    offset = block * NOISE_BLOCK_CHIRPS
+                    parts.append(
+                        noise_blocks[block][max(start, offset) - offset : stop - offset]
+                    )
+                # Later chunks start at or after ``stop``; earlier blocks are done
+                for block in [b for b in noise_blocks if b < last]:
+                    del noise_blocks[block]
+                iq += np.concatenate(parts)
+            yield start, iq.astype(np.complex64)
+
+    def _noise_block(self, block: int, shape: Tuple[int, int]) -> np.ndarray:
+        rng = np.random.default_rng([self.seed, 1, block])
+        full = (NOISE_BLOCK_CHIRPS,) + shape
+        return (self.simulator.noiseStd / math.sqrt(2)) * (
+            rng.standard_normal(full) + 1j * rng.standard_normal(full)
+        )
+
+
+class SceneSimulator:
+    """Generates reproducible multi-subject FMCW vital-sign scenes on CPU.
+
+    Breathing and heart rates follow bounded random walks, body motion adds
+    sporadic smooth displacement bursts, and each subject gets a few attenuated
+    multipath ghosts at longer range and different angles.
+    """
+
+    def __init__(
+        self,
+        fc: float = 77e9,  # Carrier frequency (Hz)
+        bandwidthHz: float = 4e9,
+        chirpDurationSec: float = 60e-6,
+        sampleRateHz: float = 5e6,  # ADC sampling rate
+        numSamples: int = 256,  # ADC samples per chirp
+        numRx: int = 4,
+        slowTimeHz: float = 100.0,  # Chirps per second used for vital signs
+        durationSec: float = 30.0,
+        rateWalkStdBpm: float = 0.05,  # Per-chirp random-walk step
+        motionEventsPerMin: float = 1.0,
+        motionAmpM: float = 0.01,
+        numMultipath: int = 2,
+        multipathAttenuation: float = 0.3,
+        noiseStd: float = 0.05,
+    ):
+        self.fc = fc
+        self.bandwidthHz = bandwidthHz
+        self.chirpDurationSec = chirpDurationSec
+        self.sampleRateHz = sampleRateHz
+        self.numSamples = numSamples
+        self.numRx = numRx
+        self.slowTimeHz = slowTimeHz
+        self.durationSec = durationSec
+        self.rateWalkStdBpm = rateWalkStdBpm
+        self.motionEventsPerMin = motionEventsPerMin
+        self.motionAmpM = motionAmpM
+        self.numMultipath = numMultipath
+        self.multipathAttenuation = multipathAttenuation
+        self.noiseStd = noiseStd
+        self.slopeHzPerSec = bandwidthHz / chirpDurationSec
+        self.wavelength = SPEED_OF_LIGHT / fc
+        self.maxRangeM = sampleRateHz * SPEED_OF_LIGHT / (2 * self.slopeHzPerSec)
+
+    def randomSubjects(
+        self, rng, numSubjects: int, minSeparationBins: int = 2
+    ) -> List[Subject]:
+        """Draws subjects at least ``minSeparationBins`` range bins apart."""
+        # Pick distinct slots twice the separation wide and jitter within the
+        # first half of each, so any two subjects stay >= one separation apart.
+        separation = minSeparationBins * self.maxRangeM / self.numSamples
+        low, high = 0.5, 0.6 * self.maxRangeM
+        num_slots = int((high - low) // (2 * separation))
+        if numSubjects > num_slots:
+            raise ValueError(
+                f"Cannot place {numSubjects} subjects {separation:.3f} m apart "
+                f"between {low} m and {high:.2f} m"
+            )
+        slots = rng.choice(num_slots, numSubjects, replace=False)
+        ranges = low + slots * 2 * separation + rng.uniform(0, separation, numSubjects)
+        return [
+            Subject(
+                rangeM=float(r),
+                angleDeg=float(rng.uniform(-60, 60)),
+                respRateBpm=float(rng.uniform(10, 24)),
+                heartRateBpm=float(rng.uniform(55, 110)),
+                respAmpM=float(rng.uniform(3e-3, 1e-2)),
+                heartAmpM=float(rng.uniform(2e-4, 8e-4)),
+                rcs=float(rng.uniform(0.5, 1.5)),
+            )
+            for r in ranges
+        ]
+
+    def _rate_walk(self, rng, baseBpm, low: float, high: float):
+        steps = rng.normal(0.0, self.rateWalkStdBpm, (baseBpm.shape[0], self._num_chirps))
+        steps[:, 0] = 0.0
+        return np.clip(baseBpm[:, None] + np.cumsum(steps, axis=1), low, high)
+
+    def _motion_artifacts(self, rng, numSubjects: int):
+        motion = np.zeros((numSubjects, self._num_chirps))
+        expected = self.motionEventsPerMin * self.durationSec / 60.0
+        for k, count in enumerate(rng.poisson(expected, numSubjects)):
+            for _ in range(count):
+                length = int(rng.uniform(0.5, 2.0) * self.slowTimeHz)
+                start = int(rng.integers(0, max(1, self._num_chirps - length)))
+                bump = np.hanning(length) * rng.normal(0.0, self.motionAmpM)
+                motion[k, start : start + length] += bump[: self._num_chirps - start]
+        return motion
+
+    @property
+    def _num_chirps(self) -> int:
+        return int(self.durationSec * self.slowTimeHz)
+
+    def simulate(
+        self, subjects: Optional[List[Subject]] = None, seed: int = 0, numSubjects: int = 2
+    ) -> VitalSignScene:
+        """Builds a scene; random subjects are drawn when ``subjects`` is None."""
+        rng = np.random.default_rng([seed, 0])
+        if subjects is None:
+            subjects = self.randomSubjects(rng, numSubjects)
+        k = len(subjects)
+        t = np.arange(self._num_chirps) / self.slowTimeHz
+
+        def attr(name):
+            return np.array([getattr(s, name) for s in subjects], dtype=float)
+
+        resp_bpm = self._rate_walk(rng, attr("respRateBpm"), 6.0, 40.0)
+        heart_bpm = self._rate_walk(rng, attr("heartRateBpm"), 40.0, 180.0)
+        # Integrate the instantaneous rate so the phase stays continuous
+        resp_phase = 2 * np.pi * np.cumsum(resp_bpm / 60.0, axis=1) / self.slowTimeHz
+        heart_phase = 2 * np.pi * np.cumsum(heart_bpm / 60.0, axis=1) / self.slowTimeHz
+        resp_phase += rng.uniform(0, 2 * np.pi, (k, 1))
+        heart_phase += rng.uniform(0, 2 * np.pi, (k, 1))
+        displacement = (
+            attr("respAmpM")[:, None] * np.sin(resp_phase)
+            + attr("heartAmpM")[:, None] * np.sin(heart_phase)
+            + self._motion_artifacts(rng, k)
+        )
+
+        # Direct paths first, then numMultipath ghosts per subject
+        base_range = attr("rangeM")
+        angles = np.deg2rad(attr("angleDeg"))
+        amps = attr("rcs") / base_range**2
+        owner = np.arange(k)
+        if self.numMultipath > 0:
+            m = self.numMultipath
+            ghost_owner = np.repeat(owner, m)
+            extra = rng.uniform(0.3, 2.0, k * m)
+            ghost_range = base_range[ghost_owner] + extra
+            ghost_angles = np.deg2rad(rng.uniform(-70, 70, k * m))
+            ghost_amps = (
+                attr("rcs")[ghost_owner]
+                * self.multipathAttenuation
+                * rng.uniform(0.3, 1.0, k * m)
+                / ghost_range**2
+            )
+            base_range = np.concatenate([base_range, ghost_range])
+            angles = np.concatenate([angles, ghost_angles])
+            amps = np.concatenate([amps, ghost_amps])
+            owner = np.concatenate([owner, ghost_owner])
+
+        ranges = base_range[:, None] + displacement[owner]
+        return VitalSignScene(
+            self,
+            subjects,
+            seed,
+            slowTime=t,
+            displacement=displacement,
+            respBpm=resp_bpm,
+            heartBpm=heart_bpm,
+            reflectorRanges=ranges,
+            reflectorAngles=angles,
+            reflectorAmps=amps,
+            reflectorSubject=owner,
+        )
+
+    def generateScenarios(
+        self,
+        numScenarios: int,
+        baseSeed: int = 0,
+        minSubjects: int = 1,
+        maxSubjects: int = 4,
+    ) -> Iterator[VitalSignScene]:
+        """Yields reproducible random scenes; scenario ``i`` uses seed ``baseSeed + i``."""
+        for i in range(numScenarios):
+            seed = baseSeed + i
+            count_rng = np.random.default_rng([seed, 2])
+            num_subjects = int(count_rng.integers(minSubjects, maxSubjects + 1))
+            yield self.simulate(seed=seed, numSubjects=num_subjects)
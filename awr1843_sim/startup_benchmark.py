@@ -0,0 +1,89 @@
+# --- Startup-time benchmark for worker processes ---
+# Run with: python -m awr1843_sim.startup_benchmark
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict
+
+# Budgets for a fresh worker process (seconds), measured inside the child
+MAX_IMPORT_SEC = 0.05
+MAX_CONSTRUCT_SEC = 0.005
+HEAVY_MODULES = ("numpy", "scipy", "matplotlib")
+
+_WORKER_SCRIPT = """
+import contextlib, io, json, sys, time
+t0 = time.perf_counter()
+import awr1843_sim
+from awr1843_sim import AWR1843Radar
+t1 = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    radar = AWR1843Radar()
+t2 = time.perf_counter()
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"import_sec": t1 - t0, "construct_sec": t2 - t1, "heavy": heavy}}))
+"""
+
+
+def measureWorkerStartup(runs: int = 5) -> Dict[str, Any]:
+    """Spawns fresh interpreters and returns the best import/construction times."""
+    best_import = float("inf")
+    best_construct = float("inf")
+    heavy_loaded = set()
+    script = _WORKER_SCRIPT.format(heavy=HEAVY_MODULES)
+    # Run from the directory holding the package, wherever the caller is
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            cwd=package_parent,
+            text=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        best_import = min(best_import, result["import_sec"])
+        best_construct = min(best_construct, result["construct_sec"])
+        heavy_loaded.update(result["heavy"])
+    return {
+        "import_sec": best_import,
+        "construct_sec": best_construct,
+        "heavy_loaded": sorted(heavy_loaded),
+    }
+
+
+class StartupBudgetError(RuntimeError):
+    pass
+
+
+def checkWorkerStartup(runs: int = 5) -> Dict[str, Any]:
+    """Raises ``StartupBudgetError`` if a worker exceeds any startup budget."""
+    result = measureWorkerStartup(runs)
+    # Explicit raises rather than assert, so the checks survive python -O
+    if result["heavy_loaded"]:
+        raise StartupBudgetError(
+            f"Heavy modules imported at startup: {result['heavy_loaded']}"
+        )
+    if result["import_sec"] > MAX_IMPORT_SEC:
+        raise StartupBudgetError(
+            f"Import took {result['import_sec'] * 1000:.2f} ms "
+            f"(budget {MAX_IMPORT_SEC * 1000:.1f} ms)"
+        )
+    if result["construct_sec"] > MAX_CONSTRUCT_SEC:
+        raise StartupBudgetError(
+            f"AWR1843Radar() took {result['construct_sec'] * 1000:.3f} ms "
+            f"(budget {MAX_CONSTRUCT_SEC * 1000:.1f} ms)"
+        )
+    return result
+
+
+if __name__ == "__main__":
+    try:
+        result = checkWorkerStartup()
+    except StartupBudgetError as exc:
+        print(f"Startup budget exceeded: {exc}")
+        sys.exit(1)
+    print(
+        f"Startup OK: import {result['import_sec'] * 1000:.2f} ms, "
+        f"construction {result['construct_sec'] * 1000:.3f} ms"
+    )
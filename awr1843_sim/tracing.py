@@ -0,0 +1,132 @@
+import json
+import math
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+# --- Per-frame latency tracing ---
+
+Span = Tuple[str, int, int]  # (stage, start_ns, end_ns) on the monotonic clock
+
+
+class FrameTrace:
+    """Frame id plus monotonic timestamps for every stage the frame went through."""
+
+    __slots__ = ("frameId", "deviceFrameNumber", "arrivalNs", "spans")
+
+    def __init__(
+        self,
+        frameId: int,
+        arrivalNs: Optional[int] = None,
+        deviceFrameNumber: Optional[int] = None,
+    ):
+        self.frameId = frameId  # Collector sequence, unique across device restarts
+        self.deviceFrameNumber = deviceFrameNumber  # Frame counter from the packet header
+        self.arrivalNs = arrivalNs  # When the packet finished arriving over UART
+        self.spans: List[Span] = []
+
+    def addSpan(self, stage: str, startNs: int, endNs: int) -> None:
+        self.spans.append((stage, startNs, endNs))
+
+    def endToEndNs(self) -> Optional[int]:
+        """Time from UART arrival (or first stage) to the end of the last stage."""
+        if not self.spans:
+            return None
+        start = self.arrivalNs
+        if start is None:
+            start = min(span[1] for span in self.spans)
+        return max(span[2] for span in self.spans) - start
+
+
+class LatencyTracer:
+    """Low-overhead collector for ``FrameTrace`` objects.
+
+    Keeps the most recent ``maxFrames`` traces in a bounded deque; recording a
+    stage is a clock read and a list append. Traces can be exported as
+    Chrome-trace / Perfetto JSON or summarized as per-stage percentiles.
+    """
+
+    def __init__(self, maxFrames: int = 10000):
+        self._traces: Deque[FrameTrace] = deque(maxlen=maxFrames)
+        self._next_frame_id = 0
+
+    @staticmethod
+    def now() -> int:
+        return time.monotonic_ns()
+
+    def newFrame(
+        self, arrivalNs: Optional[int] = None, deviceFrameNumber: Optional[int] = None
+    ) -> FrameTrace:
+        trace = FrameTrace(self._next_frame_id, arrivalNs, deviceFrameNumber)
+        self._next_frame_id += 1
+        self._traces.append(trace)
+        return trace
+
+    @property
+    def traces(self) -> List[FrameTrace]:
+        return list(self._traces)
+
+    def clear(self) -> None:
+        self._traces.clear()
+
+    def exportChromeTrace(self, path: str) -> None:
+        """Writes complete ("X") events loadable by chrome://tracing and Perfetto."""
+        events = []
+        for trace in self._traces:
+            args = {
+                "frame_id": trace.frameId,
+                "device_frame": trace.deviceFrameNumber,
+            }
+            if trace.arrivalNs is not None:
+                events.append(
+                    {
+                        "name": "uart_arrival",
+                        "cat": "frame",
+                        "ph": "i",
+                        "s": "t",
+                        "ts": trace.arrivalNs / 1000.0,
+                        "pid": 1,
+                        "tid": 1,
+                        "args": args,
+                    }
+                )
+            for stage, start_ns, end_ns in trace.spans:
+                events.append(
+                    {
+                        "name": stage,
+                        "cat": "frame",
+                        "ph": "X",
+                        "ts": start_ns / 1000.0,
+                        "dur": (end_ns - start_ns) / 1000.0,
+                        "pid": 1,
+                        "tid": 1,
+                        "args": args,
+                    }
+                )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        print(f"LatencyTracer: Exported {len(self._traces)} frames to {path}.")
+
+    def summary(
+        self, percentiles: Sequence[float] = (50, 90, 99)
+    ) -> Dict[str, Dict[str, float]]:
+        """Per-stage latency percentiles in milliseconds, plus an end-to-end entry."""
+        durations: Dict[str, List[int]] = defaultdict(list)
+        for trace in self._traces:
+            for stage, start_ns, end_ns in trace.spans:
+                durations[stage].append(end_ns - start_ns)
+            total = trace.endToEndNs()
+            if total is not None:
+                durations["end_to_end"].append(total)
+
+        result = {}
+        for stage, values in durations.items():
+            values.sort()
+            stats = {"count": float(len(values))}
+            for p in percentiles:
+                # Nearest-rank percentile
+                rank = max(1, math.ceil(p / 100.0 * len(values)))
+                stats[f"p{p:g}"] = values[rank - 1] / 1e6
+            stats["max"] = values[-1] / 1e6
+            result[stage] = stats
+        return result
@@ -0,0 +1,189 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .data_place_holders import RawData
+from .main import AWR1843Radar
+
+# --- Capture health monitoring and automatic recovery ---
+
+
+class WatchdogMetrics:
+    def __init__(self):
+        self.framesReceived = 0
+        self.framesLost = 0  # Inferred from gaps in the device frame counter
+        self.sequenceGaps = 0
+        self.stalls = 0
+        self.rateDrops = 0
+        self.recoveries = 0
+        self.failedRecoveries = 0
+        self.timeToRecoverSec: List[float] = []  # Fault detected -> next good frame
+        self.events: List[Dict[str, Any]] = []
+
+    def summary(self) -> Dict[str, Any]:
+        ttr = sorted(self.timeToRecoverSec)
+        return {
+            "frames_received": self.framesReceived,
+            "frames_lost": self.framesLost,
+            "sequence_gaps": self.sequenceGaps,
+            "stalls": self.stalls,
+            "rate_drops": self.rateDrops,
+            "recoveries": self.recoveries,
+            "failed_recoveries": self.failedRecoveries,
+            "ttr_median_sec": ttr[len(ttr) // 2] if ttr else None,
+            "ttr_max_sec": ttr[-1] if ttr else None,
+        }
+
+
+class CaptureWatchdog:
+    """Wraps ``AWR1843Radar.readData`` and restarts the capture when it goes unhealthy.
+
+    A capture is unhealthy when no frame arrived for ``stallTimeoutSec``, when
+    the device frame rate over ``rateWindowSec`` falls below ``minRateRatio``
+    of the configured rate, or when the device frame counter jumps by more
+    than ``maxGapFrames``. The rate comes from the frame counter against the
+    data UART's packet arrival times, so a consumer that reads slowly from a
+    buffered link is not mistaken for a slow device. Recovery goes through ``AWR1843Radar.recoverCapture``,
+    which restarts the sensor with its retained config and calibration
+    instead of power cycling.
+    """
+
+    def __init__(
+        self,
+        radar: AWR1843Radar,
+        stallTimeoutSec: Optional[float] = None,  # Default: 5 frame periods, >= 1 s
+        minRateRatio: float = 0.5,
+        rateWindowSec: float = 2.0,
+        maxGapFrames: int = 10,
+        maxRecoveryAttempts: int = 3,
+        retryBackoffSec: float = 0.1,
+    ):
+        self.radar = radar
+        self.stallTimeoutSec = stallTimeoutSec
+        self.minRateRatio = minRateRatio
+        self.rateWindowSec = rateWindowSec
+        self.maxGapFrames = maxGapFrames
+        self.maxRecoveryAttempts = maxRecoveryAttempts
+        self.retryBackoffSec = retryBackoffSec
+        self.metrics = WatchdogMetrics()
+        self.healthy = True  # False once recovery has been given up
+        # (packet arrival, device frame number) of recent frames, for the rate check
+        self._frame_times: Deque[Tuple[float, int]] = deque()
+        self._last_frame_number: Optional[int] = None
+        self._last_good = time.monotonic()
+        self._window_start = self._last_good
+        self._fault_detected_at: Optional[float] = None
+        print("CaptureWatchdog initialized.")
+
+    def _frame_period(self) -> Optional[float]:
+        frame = self.radar.frameConfig
+        if frame is None or frame.periodUsec <= 0:
+            return None
+        return frame.periodUsec / 1e6
+
+    def _stall_timeout(self) -> float:
+        if self.stallTimeoutSec is not None:
+            return self.stallTimeoutSec
+        period = self._frame_period()
+        return max(1.0, 5 * period) if period else 1.0
+
+    def _reset_tracking(self, now: float) -> None:
+        self._frame_times.clear()
+        self._last_frame_number = None
+        self._last_good = now
+        self._window_start = now
+
+    def _check_sequence(self, raw: RawData) -> Optional[str]:
+        if raw.frameNumber is None:
+            return None
+        last = self._last_frame_number
+        self._last_frame_number = raw.frameNumber
+        if last is None:
+            return None
+        # Signed 32-bit difference, so wrap-around still counts forward
+        delta = ((raw.frameNumber - last + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+        if delta < 0:
+            # Counter went backwards: the sensor was restarted behind our back
+            print(f"CaptureWatchdog: Frame counter reset ({last} -> {raw.frameNumber}).")
+            self._reset_tracking(time.monotonic())
+            self._last_frame_number = raw.frameNumber
+            return None
+        missing = delta - 1
+        if missing <= 0:
+            return None
+        self.metrics.sequenceGaps += 1
+        self.metrics.framesLost += missing
+        if missing > self.maxGapFrames:
+            return f"sequence gap of {missing} frames"
+        return None
+
+    def _check_rate(self, raw: RawData, now: float) -> Optional[str]:
+        period = self._frame_period()
+        arrival_ns = self.radar.dataUartInterface.lastPacketArrivalNs
+        if period is None or raw.frameNumber is None or not arrival_ns:
+            return None
+        arrival = arrival_ns / 1e9
+        self._frame_times.append((arrival, raw.frameNumber))
+        while arrival - self._frame_times[0][0] > self.rateWindowSec:
+            self._frame_times.popleft()
+        first_arrival, first_number = self._frame_times[0]
+        span = arrival - first_arrival
+        if now - self._window_start < self.rateWindowSec or span < self.rateWindowSec / 2:
+            return None
+        # Frames the device produced (lost ones included; gaps are checked
+        # separately) over the time their packets took to come off the wire
+        produced = ((raw.frameNumber - first_number + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+        rate = produced / span
+        if rate < self.minRateRatio / period:
+            self.metrics.rateDrops += 1
+            return f"frame rate {rate:.1f} fps below {self.minRateRatio / period:.1f} fps"
+        return None
+
+    def _recover(self, reason: str, detected_at: float) -> bool:
+        print(f"CaptureWatchdog: Unhealthy capture ({reason}), recovering...")
+        if self._fault_detected_at is None:
+            self._fault_detected_at = detected_at
+        for attempt in range(1, self.maxRecoveryAttempts + 1):
+            started = time.monotonic()
+            ok = self.radar.recoverCapture()
+            self.metrics.events.append(
+                {
+                    "time": started,
+                    "reason": reason,
+                    "attempt": attempt,
+                    "success": ok,
+                    "duration_sec": time.monotonic() - started,
+                }
+            )
+            if ok:
+                self.metrics.recoveries += 1
+                self._reset_tracking(time.monotonic())
+                return True
+            self.metrics.failedRecoveries += 1
+            time.sleep(self.retryBackoffSec * attempt)
+        print("CaptureWatchdog: Recovery failed, giving up.")
+        self.healthy = False
+        return False
+
+    def readFrame(self) -> Optional[RawData]:
+        """Reads one frame, recovering the capture first if it has become unhealthy."""
+        if not self.healthy:
+            return None
+        raw = self.radar.readData()
+        now = time.monotonic()
+        if raw is None:
+            if now - self._last_good >= self._stall_timeout():
+                self.metrics.stalls += 1
+                self._recover(f"no frame for {now - self._last_good:.2f} s", now)
+            return None
+
+        if self._fault_detected_at is not None:
+            self.metrics.timeToRecoverSec.append(now - self._fault_detected_at)
+            self._fault_detected_at = None
+        self.metrics.framesReceived += 1
+        self._last_good = now
+        reason = self._check_sequence(raw) or self._check_rate(raw, now)
+        if reason:
+            # The frame itself is good; hand it out and restart behind it
+            self._recover(reason, now)
+        return raw
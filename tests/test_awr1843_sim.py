@@ -0,0 +1,569 @@
+import time
+
+import pytest
+
+from awr1843_sim.device_emulator import (
+    AWR1843DeviceEmulator,
+    EmulatedUARTInterface,
+    FaultConfig,
+)
+
+
+def _emulated_link(faults=None, payloadBytes=256):
+    emulator = AWR1843DeviceEmulator(faults=faults, payloadBytes=payloadBytes)
+    cli = EmulatedUARTInterface("EMU_CLI", 115200, emulator, "cli")
+    data = EmulatedUARTInterface("EMU_DATA", 921600, emulator, "data")
+    return emulator, cli, data
+
+
+def _start_streaming(cli, periodMs=10.0):
+    cli.sendCommand(f"frameCfg 0 0 16 0 {periodMs:.3f} 1 0.0 0")
+    assert cli.readResponse() == "Done"
+    cli.sendCommand("sensorStart")
+    assert cli.readResponse() == "Done"
+
+
+def test_read_response_strips_echo_and_prompt():
+    emulator, cli, data = _emulated_link()
+    try:
+        cli.sendCommand("sensorStop")
+        assert cli.readResponse() == "Done"
+        cli.sendCommand("bogusCmd 1 2")
+        assert cli.readResponse() == "'bogusCmd' is not recognized as a CLI command"
+    finally:
+        emulator.stop()
+
+
+def test_packets_survive_crc_errors_and_dropped_bytes():
+    faults = FaultConfig(crcErrorProb=0.3, dropBytesProb=0.3, seed=7)
+    emulator, cli, data = _emulated_link(faults)
+    try:
+        data._ensure_open()
+        _start_streaming(cli)
+        payloads = [data.readDataPortPacket(256) for _ in range(15)]
+    finally:
+        emulator.stop()
+    assert all(p is not None and len(p) == 256 for p in payloads)
+    # Payload bytes are (frameNumber + i) % 256, so a corrupt frame can't slip through
+    for payload in payloads:
+        assert all((payload[i] - payload[0]) % 256 == i for i in range(len(payload)))
+    assert data.crcErrors > 0
+    assert data.bytesDiscarded > 0
+
+
+def test_idle_reader_causes_overrun_not_backpressure():
+    emulator = AWR1843DeviceEmulator(payloadBytes=256, rxBufferBytes=2048)
+    cli = EmulatedUARTInterface("EMU_CLI", 115200, emulator, "cli")
+    data = EmulatedUARTInterface("EMU_DATA", 921600, emulator, "data")
+    try:
+        data._ensure_open()
+        _start_streaming(cli, periodMs=10.0)
+        time.sleep(0.5)
+        sent = emulator.framesSent
+    finally:
+        emulator.stop()
+    assert sent >= 30  # Frame clock kept running with nobody reading
+    assert emulator.framesOverrun > 0
+    assert emulator.overrunBytes > 0
+
+
+def test_closing_data_channel_stops_its_thread():
+    emulator, cli, data = _emulated_link()
+    try:
+        cli._ensure_open()
+        data._ensure_open()
+        thread = emulator._threads["data"]
+        started = time.monotonic()
+        data.close()
+        assert time.monotonic() - started < 0.5
+        assert not thread.is_alive()
+    finally:
+        emulator.stop()
+
+
+def test_radar_runs_on_emulated_interfaces():
+    from awr1843_sim.configs import ChirpConfig, FrameConfig, ProfileConfig
+    from awr1843_sim.main import AWR1843Radar
+
+    emulator, cli, data = _emulated_link(payloadBytes=1024)
+    radar = AWR1843Radar(uart_interface=cli, data_uart_interface=data)
+    try:
+        radar.powerOn()
+        assert radar.initialize()
+        assert radar.configureProfile(ProfileConfig(0, 77.0, 77.4, 7.0, 5.0, 50.0))
+        assert radar.configureChirps([ChirpConfig(0, 0, 0, 0)])
+        assert radar.configureFrame(FrameConfig(0, 0, 0, 16, 10000))
+        assert radar.startCapture()
+        raw = radar.readData()
+        assert raw is not None and len(raw.data) == 1024
+    finally:
+        radar.powerOff()
+
+
+def _brute_force_dbscan(coords, eps, epsDoppler, minPoints):
+    scale = eps / epsDoppler
+    pts = [(x, y, z, v * scale) for x, y, z, v in coords]
+
+    def neighbors(i):
+        return [
+            j
+            for j in range(len(pts))
+            if sum((a - b) ** 2 for a, b in zip(pts[i], pts[j])) <= eps * eps
+        ]
+
+    core = {i for i in range(len(pts)) if len(neighbors(i)) >= minPoints}
+    # Core points are grouped by connectivity; border points may join any adjacent core
+    clusters = []
+    seen = set()
+    for i in sorted(core):
+        if i in seen:
+            continue
+        group, stack = set(), [i]
+        while stack:
+            j = stack.pop()
+            if j in group:
+                continue
+            group.add(j)
+            stack.extend(n for n in neighbors(j) if n in core)
+        seen |= group
+        clusters.append(group)
+    return core, clusters, neighbors
+
+
+def test_grid_dbscan_matches_brute_force():
+    import random
+
+    from awr1843_sim.clustering import PointCloudClustering
+
+    rng = random.Random(3)
+    coords = []
+    for _ in range(8):
+        cx, cy, cv = rng.uniform(0, 10), rng.uniform(0, 10), rng.uniform(-2, 2)
+        for _ in range(rng.randint(2, 25)):
+            coords.append(
+                (cx + rng.gauss(0, 0.2), cy + rng.gauss(0, 0.2), rng.gauss(0, 0.1), cv)
+            )
+    coords += [(rng.uniform(-5, 15), rng.uniform(-5, 15), 0.0, 0.0) for _ in range(20)]
+
+    clustering = PointCloudClustering(eps=0.4, epsDoppler=0.5, minPoints=4)
+    labels = clustering.labelPoints(coords)
+    core, clusters, neighbors = _brute_force_dbscan(coords, 0.4, 0.5, 4)
+    assert len(clusters) >= 3 and -1 in labels
+
+    # Same partition of core points
+    grid_core_groups = {}
+    for i in core:
+        grid_core_groups.setdefault(labels[i], set()).add(i)
+    assert sorted(map(sorted, grid_core_groups.values())) == sorted(map(sorted, clusters))
+    # Border points belong to a cluster of an adjacent core point; the rest is noise
+    for i, label in enumerate(labels):
+        if i in core:
+            continue
+        adjacent = {labels[j] for j in neighbors(i) if j in core}
+        if adjacent:
+            assert label in adjacent
+        else:
+            assert label == -1
+
+
+def test_streaming_stft_matches_full_recompute():
+    np = pytest.importorskip("numpy")
+    from awr1843_sim.micro_doppler import MicroDopplerSTFT
+
+    num_bins, window, hop, history = 3, 32, 8, 16
+    rng = np.random.default_rng(0)
+    total = 600
+    signal = (
+        rng.standard_normal((num_bins, total)) + 1j * rng.standard_normal((num_bins, total))
+    ).astype(np.complex64)
+    stft = MicroDopplerSTFT(num_bins, window, hop, history, logScale=False)
+    pos = 0
+    while pos < total:  # Frames of uneven size, not aligned to the hop
+        n = int(rng.integers(1, 30))
+        stft.push(signal[:, pos : pos + n])
+        pos += n
+
+    hann = np.hanning(window)
+    columns = [
+        np.abs(np.fft.fftshift(np.fft.fft(signal[:, end - window : end] * hann, axis=1), axes=1))
+        for end in range(hop, total + 1, hop)
+        if end >= window
+    ]
+    expected = np.stack(columns[-history:], axis=-1)
+    view = stft.spectrogram()
+    assert stft.columnsComputed == len(columns)
+    assert np.allclose(view, expected, rtol=1e-4, atol=1e-4)
+    assert np.shares_memory(view, stft.spectrogram(1)) and not view.flags.writeable
+
+
+def _emulated_radar(tracer=None):
+    from awr1843_sim.configs import ChirpConfig, FrameConfig, ProfileConfig
+    from awr1843_sim.main import AWR1843Radar
+
+    emulator, cli, data = _emulated_link()
+    radar = AWR1843Radar(uart_interface=cli, data_uart_interface=data, tracer=tracer)
+    radar.powerOn()
+    assert radar.initialize()
+    assert radar.configureProfile(ProfileConfig(0, 77.0, 77.4, 7.0, 5.0, 50.0))
+    assert radar.configureChirps([ChirpConfig(0, 0, 0, 0)])
+    assert radar.configureFrame(FrameConfig(0, 0, 0, 16, 10000))
+    assert radar.startCapture()
+    return emulator, radar
+
+
+def test_emulator_rejects_duplicate_profile_without_flush():
+    emulator, radar = _emulated_radar()
+    try:
+        radar.stopCapture()
+        assert not radar._send_config_command(radar.profileConfig.toCommandString())
+        assert radar._send_config_command("flushCfg")
+        assert radar._send_config_command(radar.profileConfig.toCommandString())
+    finally:
+        radar.powerOff()
+
+
+def test_watchdog_recovers_after_forced_gap():
+    from awr1843_sim.watchdog import CaptureWatchdog
+
+    emulator, radar = _emulated_radar()
+    watchdog = CaptureWatchdog(radar, maxGapFrames=5)
+    try:
+        assert watchdog.readFrame() is not None
+        emulator._frame_number += 50  # Device skips ahead: a large sequence gap
+        for _ in range(10):
+            watchdog.readFrame()
+    finally:
+        radar.powerOff()
+    assert watchdog.healthy
+    assert watchdog.metrics.recoveries == 1
+    assert watchdog.metrics.framesLost >= 50
+    assert len(watchdog.metrics.timeToRecoverSec) == 1
+    assert watchdog.metrics.framesReceived == 11
+
+
+def test_recover_capture_falls_back_to_full_reconfig():
+    emulator, radar = _emulated_radar()
+    try:
+        assert radar.calibrate() and radar.startCapture()
+        sent = []
+        send = radar.uartInterface.sendCommand
+        radar.uartInterface.sendCommand = lambda cmd: (sent.append(cmd), send(cmd))
+        emulator._config_applied = False  # Firmware lost its config: sensorStart 0 fails
+        assert radar.recoverCapture()
+        assert radar.readData() is not None
+        assert radar.calibrated and radar.calibration_module.is_calibrated
+    finally:
+        radar.powerOff()
+    flush = sent.index("flushCfg")
+    calib = [i for i, cmd in enumerate(sent) if cmd.startswith("calibDcRangeSigCfg")]
+    assert len(calib) == 2 and flush < min(calib) and max(calib) < sent.index("sensorStart")
+
+
+def test_recover_capture_marks_uncalibrated_when_replay_fails():
+    emulator, radar = _emulated_radar()
+    try:
+        assert radar.calibrate() and radar.startCapture()
+        radar.calibration_module._calib_commands = ["bogusCalibCmd 1"]
+        emulator._config_applied = False
+        assert radar.recoverCapture()
+        assert not radar.calibrated
+        assert not radar.calibration_module.is_calibrated
+    finally:
+        radar.powerOff()
+
+
+def test_watchdog_treats_counter_reset_as_restart():
+    from awr1843_sim.watchdog import CaptureWatchdog
+
+    emulator, radar = _emulated_radar()
+    watchdog = CaptureWatchdog(radar)
+    try:
+        for _ in range(3):
+            watchdog.readFrame()
+        emulator._frame_number = 0  # Sensor restarted outside the watchdog
+        for _ in range(5):
+            watchdog.readFrame()
+    finally:
+        radar.powerOff()
+    assert watchdog.metrics.recoveries == 0
+    assert watchdog.metrics.framesLost < 5
+
+
+def test_watchdog_recovers_from_stall():
+    from awr1843_sim.watchdog import CaptureWatchdog
+
+    emulator, radar = _emulated_radar()
+    watchdog = CaptureWatchdog(radar, stallTimeoutSec=0.3)
+    try:
+        assert watchdog.readFrame() is not None
+        emulator._streaming.clear()  # Device stops framing without a sensorStop
+        for _ in range(5):  # Frames already in the host buffer still come through
+            if watchdog.readFrame() is None:
+                break
+        assert watchdog.metrics.stalls == 1
+        assert watchdog.readFrame() is not None
+    finally:
+        radar.powerOff()
+    assert watchdog.healthy
+    assert watchdog.metrics.stalls == 1
+    assert watchdog.metrics.recoveries == 1
+    assert len(watchdog.metrics.timeToRecoverSec) == 1
+
+
+def test_watchdog_recovers_from_rate_drop():
+    from awr1843_sim.watchdog import CaptureWatchdog
+
+    emulator, radar = _emulated_radar()
+    watchdog = CaptureWatchdog(radar, rateWindowSec=0.5)
+    try:
+        emulator.framePeriodSec = 0.05  # 20 fps against a configured 100 fps
+        deadline = time.monotonic() + 3.0
+        while watchdog.metrics.recoveries == 0 and time.monotonic() < deadline:
+            watchdog.readFrame()
+    finally:
+        radar.powerOff()
+    assert watchdog.metrics.rateDrops >= 1
+    assert watchdog.metrics.recoveries >= 1
+    assert watchdog.metrics.sequenceGaps == 0
+
+
+def test_watchdog_ignores_slow_consumer():
+    from awr1843_sim.watchdog import CaptureWatchdog
+
+    emulator, radar = _emulated_radar()
+    watchdog = CaptureWatchdog(radar, rateWindowSec=1.0)
+    try:
+        deadline = time.monotonic() + 2.5
+        while time.monotonic() < deadline:
+            assert watchdog.readFrame() is not None
+            time.sleep(0.03)  # Consumer needs 30 ms per 10 ms frame
+    finally:
+        radar.powerOff()
+    assert emulator.framesOverrun == 0  # Frames queued up in the host buffer
+    assert watchdog.metrics.rateDrops == 0
+    assert watchdog.metrics.recoveries == 0
+
+
+PIPELINE_STAGES = ["uart_read", "capture_adc", "read_data", "parse_raw", "cfar", "clustering"]
+
+
+def _traced_frames(numFrames):
+    from awr1843_sim.tracing import LatencyTracer
+
+    tracer = LatencyTracer()
+    emulator, radar = _emulated_radar(tracer)
+    device_frames = []
+    try:
+        for _ in range(numFrames):
+            raw = radar.readData()
+            assert raw is not None
+            device_frames.append(raw.frameNumber)
+            processing = radar.data_processing_module
+            clustered = processing.clusterTargets(
+                processing.applyCFAR(processing.parseRaw(raw))
+            )
+            assert clustered.trace is raw.trace
+    finally:
+        radar.powerOff()
+    return tracer, device_frames
+
+
+def test_tracer_records_every_pipeline_stage():
+    tracer, device_frames = _traced_frames(5)
+    traces = tracer.traces
+    assert [t.frameId for t in traces] == list(range(5))
+    assert [t.deviceFrameNumber for t in traces] == device_frames
+    for trace in traces:
+        assert [span[0] for span in trace.spans] == PIPELINE_STAGES
+        assert all(start <= end for _, start, end in trace.spans)
+        assert trace.arrivalNs is not None and trace.endToEndNs() > 0
+
+
+def test_tracer_exports_chrome_trace(tmp_path):
+    import json
+
+    tracer, device_frames = _traced_frames(3)
+    path = tmp_path / "trace.json"
+    tracer.exportChromeTrace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+
+    instants = [e for e in events if e["ph"] == "i"]
+    complete = [e for e in events if e["ph"] == "X"]
+    assert len(instants) == 3 and len(complete) == 3 * len(PIPELINE_STAGES)
+    assert all(e["name"] == "uart_arrival" for e in instants)
+    assert {e["name"] for e in complete} == set(PIPELINE_STAGES)
+    assert all(e["dur"] >= 0 and "ts" in e for e in complete)
+    assert [e["args"]["device_frame"] for e in instants] == device_frames
+    assert [e["args"]["frame_id"] for e in instants] == [0, 1, 2]
+
+
+def test_tracer_summary_percentiles():
+    from awr1843_sim.tracing import LatencyTracer
+
+    tracer = LatencyTracer()
+    ms = 1_000_000
+    for i in range(1, 11):  # parse_raw takes 1..10 ms, cfar takes 2 ms
+        trace = tracer.newFrame(arrivalNs=0)
+        trace.addSpan("parse_raw", 0, i * ms)
+        trace.addSpan("cfar", i * ms, (i + 2) * ms)
+    untimed = tracer.newFrame()  # No arrival: end-to-end starts at the first span
+    untimed.addSpan("cfar", 100 * ms, 102 * ms)
+
+    summary = tracer.summary(percentiles=(50, 90, 99))
+    assert summary["parse_raw"] == {
+        "count": 10, "p50": 5.0, "p90": 9.0, "p99": 10.0, "max": 10.0
+    }
+    assert summary["cfar"]["count"] == 11
+    assert summary["cfar"]["p50"] == summary["cfar"]["max"] == 2.0
+    # End-to-end: 3..12 ms from arrival for the timed frames, 2 ms for the untimed one
+    assert summary["end_to_end"] == {
+        "count": 11, "p50": 7.0, "p90": 11.0, "p99": 12.0, "max": 12.0
+    }
+
+
+def _small_scene_simulator(**kwargs):
+    from awr1843_sim.scene_simulator import SceneSimulator
+
+    params = dict(numSamples=64, durationSec=3.0, numMultipath=1)
+    params.update(kwargs)
+    return SceneSimulator(**params)
+
+
+def test_scene_noise_does_not_depend_on_chunk_size():
+    np = pytest.importorskip("numpy")
+
+    scene = _small_scene_simulator().simulate(seed=5)
+
+    def full_iq(chunkChirps):
+        chunks = list(scene.iterChunks(chunkChirps))
+        assert [start for start, _ in chunks] == list(range(0, scene.numChirps, chunkChirps))
+        return np.concatenate([iq for _, iq in chunks])
+
+    reference = full_iq(100)
+    assert reference.shape == (scene.numChirps, 4, 64)
+    for chunk in (256, 7, scene.numChirps):
+        assert np.array_equal(full_iq(chunk), reference)
+
+
+def test_scene_phase_follows_displacement():
+    np = pytest.importorskip("numpy")
+    from awr1843_sim.scene_simulator import Subject
+
+    sim = _small_scene_simulator(numMultipath=0, noiseStd=0.0, motionEventsPerMin=0.0)
+    subject = Subject(rangeM=2.0, respAmpM=2e-3, heartAmpM=2e-4)
+    scene = sim.simulate(subjects=[subject], seed=1)
+    iq = np.concatenate([chunk for _, chunk in scene.iterChunks()])
+
+    range_bin = round(subject.rangeM / (sim.maxRangeM / sim.numSamples))
+    spectrum = np.fft.fft(iq[:, 0, :], axis=1)
+    assert np.argmax(np.abs(spectrum).mean(axis=0)) == range_bin
+    phase = np.unwrap(np.angle(spectrum[:, range_bin]))
+    displacement = scene.displacement[0]
+    expected = 4 * np.pi / sim.wavelength * (displacement - displacement[0])
+    assert np.ptp(expected) > 2 * np.pi  # Breathing spans several phase wraps
+    assert np.allclose(phase - phase[0], expected, atol=0.1)
+
+
+def test_scene_simulation_is_reproducible():
+    np = pytest.importorskip("numpy")
+
+    sim = _small_scene_simulator()
+    first, again, other = sim.simulate(seed=3), sim.simulate(seed=3), sim.simulate(seed=4)
+    assert [s.rangeM for s in first.subjects] == [s.rangeM for s in again.subjects]
+    assert np.array_equal(first.displacement, again.displacement)
+    assert np.array_equal(first.reflectorRanges, again.reflectorRanges)
+    assert np.array_equal(next(first.iterChunks())[1], next(again.iterChunks())[1])
+    assert not np.array_equal(first.displacement, other.displacement)
+
+    scenarios = list(sim.generateScenarios(4, baseSeed=10))
+    repeated = list(sim.generateScenarios(4, baseSeed=10))
+    for i, (scene, repeat) in enumerate(zip(scenarios, repeated)):
+        assert scene.seed == repeat.seed == 10 + i
+        assert 1 <= len(scene.subjects) <= 4
+        assert np.array_equal(scene.displacement, repeat.displacement)
+        assert np.array_equal(scene.reflectorRanges, repeat.reflectorRanges)
+        direct = sim.simulate(seed=10 + i, numSubjects=len(scene.subjects))
+        assert np.array_equal(scene.reflectorRanges, direct.reflectorRanges)
+
+
+def test_random_subjects_keep_minimum_separation():
+    np = pytest.importorskip("numpy")
+
+    sim = _small_scene_simulator()
+    rng = np.random.default_rng(0)
+    separation = 3 * sim.maxRangeM / sim.numSamples
+    for _ in range(50):
+        ranges = sorted(s.rangeM for s in sim.randomSubjects(rng, 4, minSeparationBins=3))
+        assert all(b - a >= separation for a, b in zip(ranges, ranges[1:]))
+        assert ranges[0] >= 0.5 and ranges[-1] <= 0.6 * sim.maxRangeM
+
+    with pytest.raises(ValueError):
+        sim.randomSubjects(rng, 20, minSeparationBins=3)
+
+
+def test_radar_modules_can_be_replaced():
+    from awr1843_sim.clustering import PointCloudClustering
+    from awr1843_sim.data_processing import DataProcessing
+    from awr1843_sim.main import AWR1843Radar
+
+    processing = DataProcessing(clustering=PointCloudClustering(eps=1.0))
+    radar = AWR1843Radar(data_processing_module=processing)
+    assert radar.data_processing_module is processing
+    assert radar._data_acquisition_module is None  # Still created lazily
+
+    replacement = DataProcessing(clustering=PointCloudClustering(eps=2.0))
+    radar.data_processing_module = replacement
+    assert radar.data_processing_module is replacement
+
+
+def test_worker_startup_stays_within_budget():
+    from awr1843_sim.startup_benchmark import checkWorkerStartup
+
+    result = checkWorkerStartup(runs=3)
+    assert result["heavy_loaded"] == []
+
+
+def _two_blob_targets():
+    from awr1843_sim.data_place_holders import TargetList
+
+    def target(i, x, y, z, v):
+        return {"id": i, "position": (x, y, z), "velocity": v}
+
+    blob_a = [(1.0, 1.0), (1.2, 1.0), (1.0, 1.2), (1.2, 1.2)]  # Velocity 0.5
+    blob_b = [(5.0, 5.0), (5.3, 5.0), (5.0, 5.3), (5.3, 5.3), (5.15, 5.15)]  # Velocity -1
+    detections = [target(i, x, y, 0.0, 0.5) for i, (x, y) in enumerate(blob_a)]
+    detections += [target(10 + i, x, y, 0.1, -1.0) for i, (x, y) in enumerate(blob_b)]
+    # Isolated detections, and one next to blob A but moving the other way
+    detections += [target(20, 10.0, 0.0, 0.0, 0.0), target(21, 0.0, 10.0, 0.0, 0.0)]
+    detections.append(target(22, 1.1, 1.1, 0.0, 5.0))
+    return TargetList(detections)
+
+
+def _assert_two_blob_clusters(clustered):
+    clusters = sorted(clustered.targets, key=lambda c: c["num_points"])
+    assert [c["num_points"] for c in clusters] == [4, 5]  # Noise points excluded
+    a, b = clusters
+    assert a["position"] == pytest.approx((1.1, 1.1, 0.0))
+    assert a["velocity"] == pytest.approx(0.5)
+    assert a["extent"] == pytest.approx((0.2, 0.2, 0.0))
+    assert b["position"] == pytest.approx((5.15, 5.15, 0.1))
+    assert b["velocity"] == pytest.approx(-1.0)
+    assert b["extent"] == pytest.approx((0.3, 0.3, 0.0))
+    assert a["id"] != b["id"]
+
+
+def test_clustering_collapses_blobs_into_centroids():
+    from awr1843_sim.clustering import PointCloudClustering
+
+    clustering = PointCloudClustering(eps=0.5, epsDoppler=1.0, minPoints=3)
+    _assert_two_blob_clusters(clustering.cluster(_two_blob_targets()))
+
+
+def test_cluster_targets_uses_configured_clustering():
+    from awr1843_sim.clustering import PointCloudClustering
+    from awr1843_sim.data_processing import DataProcessing
+
+    processing = DataProcessing(clustering=PointCloudClustering(eps=0.5, minPoints=3))
+    clustered = processing.clusterTargets(_two_blob_targets())
+    _assert_two_blob_clusters(clustered)
+    assert clustered.trace is None
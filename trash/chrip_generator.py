@@ -1,5 +1,5 @@
-import matplotlib.pyplot as plt
-import numpy as np
+# NumPy and matplotlib are imported inside the methods that need them so that
+# importing this module stays cheap for short-lived processes.
 
 
 # -------------------------------------------------------------------------#
@@ -25,6 +25,8 @@ class FMCWChirpGenerator:
         Generate one FMCW chirp signal (complex baseband)
         :return: t (time axis), signal (complex IQ samples)
         """
+        import numpy as np
+
         N = int(self.T_chirp * self.fs)
         t = np.linspace(0, self.T_chirp, N, endpoint=False)
         # Baseband chirp (complex)
@@ -33,6 +35,9 @@ class FMCWChirpGenerator:
         return t, signal
 
     def plot_time_domain(self, t, signal):
+        import matplotlib.pyplot as plt
+        import numpy as np
+
         plt.figure(figsize=(8, 3))
         plt.plot(t * 1e3, np.real(signal), label="I (Real)")
         plt.plot(t * 1e3, np.imag(signal), label="Q (Imag)")
@@ -44,6 +49,9 @@ class FMCWChirpGenerator:
         plt.show()
 
     def plot_spectrum(self, signal):
+        import matplotlib.pyplot as plt
+        import numpy as np
+
         N = len(signal)
         # FFT and frequency axis
         spectrum = np.fft.fftshift(np.fft.fft(signal))
@@ -1,6 +1,5 @@
-import matplotlib.pyplot as plt
-import numpy as np
-
+# NumPy is imported inside the methods that need it (matplotlib only in the
+# usage example below) so that importing this module stays cheap.
 from chrip_generator import FMCWChirpGenerator
 
 
@@ -15,6 +14,8 @@ class VitalSignSimulator:
         self.c = 3e8
 
     def _generate_motion(self):
+        import numpy as np
+
         t = np.linspace(0, self.duration, int(self.fs * self.duration))
         resp_rate = np.random.uniform(12, 20) / 60
         heart_rate = np.random.uniform(60, 100) / 60
@@ -24,6 +25,8 @@ class VitalSignSimulator:
         return t, disp, resp_rate * 60, heart_rate * 60
 
     def generate_vital_sign_signal(self):
+        import numpy as np
+
         t_disp, disp, resp_bpm, hr_bpm = self._generate_motion()
         t_chirp, base_chirp = self.chirp_gen.generate_chirp()
         lambda_c = self.c / self.chirp_gen.fc
@@ -48,6 +51,9 @@ class VitalSignSimulator:
 #                           EXAMPLE OF USAGE                               #
 # -------------------------------------------------------------------------#
 
+# import matplotlib.pyplot as plt
+# import numpy as np
+
 # Recreate the chirp generator
 # chirp_gen = FMCWChirpGenerator(fc=60e9, B=4e9, T_chirp=1e-3, fs=20e6)
 # # Simulate and plot